@@ -0,0 +1,129 @@
+"""Shared helpers for the test suite."""
+import copy
+import json
+import os
+import unittest
+
+from click.testing import CliRunner
+from rich.console import Console
+
+import todo.cli
+from todo.models import Todo, TodoStore
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+# CliRunner keeps no state between invocations, so every test shares one
+CLI_RUNNER = CliRunner()
+
+
+class InMemoryTodoStore(TodoStore):
+    """TodoStore that keeps its serialized state in memory instead of on disk."""
+
+    # Set on stores shared across tests so that any write fails loudly
+    read_only = False
+
+    def __init__(self, data=None):
+        self._data = dict(data or {})
+        super().__init__(storage_path=":memory:")
+
+    def _load(self) -> None:
+        """Load todos from the in-memory buffer; there is no file to read."""
+        self.todos = {
+            todo_id: Todo.from_dict(todo_data)
+            for todo_id, todo_data in self._data.items()
+        }
+        self._rebuild_indexes()
+
+    def _save(self) -> bool:
+        """Serialize todos into the in-memory buffer; this cannot fail."""
+        if self.read_only:
+            raise AssertionError("attempted to modify a read-only shared store")
+        self._data = {
+            todo_id: todo.to_dict()
+            for todo_id, todo in self.todos.items()
+        }
+        return True
+
+    def _append(self, records) -> None:
+        """Re-serialize the whole buffer; there is no log to append to."""
+        self._save()
+
+    def __copy__(self) -> 'InMemoryTodoStore':
+        """Clone the store without re-running __init__, giving the clone its own containers."""
+        clone = self.__class__.__new__(self.__class__)
+        clone.__dict__.update(self.__dict__)
+        clone.todos = dict(self.todos)
+        clone._by_status = {status: dict(todos) for status, todos in self._by_status.items()}
+        clone._data = dict(self._data)
+        return clone
+
+
+def quiet_console(file=None) -> Console:
+    """Build a console like todo.cli's that never emits ANSI styling, for rendering in tests."""
+    return Console(
+        file=file, force_terminal=False, color_system=None, no_color=True, width=200,
+        highlight=False, emoji=False,
+    )
+
+
+def load_fixture(name: str) -> dict:
+    """Return the serialized todos stored in tests/fixtures/<name>."""
+    with open(os.path.join(FIXTURES_DIR, name), "r") as f:
+        return json.load(f)
+
+
+# Built once; tests work on copies
+EMPTY_STORE = InMemoryTodoStore()
+# Two pending todos (high; medium on test.py) and one completed low priority todo
+SEEDED_STORE = InMemoryTodoStore(load_fixture("three_todos.json"))
+
+
+class CliTestCase(unittest.TestCase):
+    """Points todo.cli.store at a fresh in-memory store for every test."""
+
+    runner = CLI_RUNNER
+
+    @classmethod
+    def setUpClass(cls):
+        """Remember the real store."""
+        super().setUpClass()
+        cls._orig_store = todo.cli.store
+
+    def setUp(self):
+        """Swap in a store that never touches the filesystem."""
+        self.mock_store = copy.copy(EMPTY_STORE)
+        todo.cli.store = self.mock_store
+
+    def tearDown(self):
+        """Restore the real store."""
+        todo.cli.store = self._orig_store
+
+
+class SharedStoreCliTestCase(unittest.TestCase):
+    """Points todo.cli.store at one store for the whole class.
+
+    Only for tests that never modify the store; the store is marked read-only
+    so a write fails instead of leaking into other tests.
+    """
+
+    runner = CLI_RUNNER
+
+    @classmethod
+    def build_store(cls) -> InMemoryTodoStore:
+        """Return the store the class reads from; empty unless overridden."""
+        return copy.copy(EMPTY_STORE)
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the shared store and wire it into the CLI."""
+        super().setUpClass()
+        cls._orig_store = todo.cli.store
+        cls.shared_store = cls.build_store()
+        cls.shared_store.read_only = True
+        todo.cli.store = cls.shared_store
+
+    @classmethod
+    def tearDownClass(cls):
+        """Restore the real store."""
+        todo.cli.store = cls._orig_store
+        super().tearDownClass()
@@ -1,101 +1,155 @@
 """Tests for the CLI interface."""
-import os
-import tempfile
+import copy
+import io
 import unittest
-from unittest.mock import patch
-from click.testing import CliRunner
 
+import todo.cli
 from todo.cli import cli  # Import the cli group instead of individual functions
-from todo.models import Todo, TodoStore, Priority, Status
+from todo.cli import add, complete, pending  # Commands called directly via _capture
+from todo.models import Todo, Priority, Status
+from tests.support import (
+    CLI_RUNNER, EMPTY_STORE, SEEDED_STORE, CliTestCase, InMemoryTodoStore,
+    SharedStoreCliTestCase, quiet_console,
+)
 
+# (shorthand, full) priority pairs accepted by the -p option
+SHORTHAND_PRIORITIES = [("h", "high"), ("m", "medium"), ("l", "low")]
 
-class TestCli(unittest.TestCase):
-    def setUp(self):
-        """Set up a test environment."""
-        # Create a temporary file for the todo store
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.temp_file.close()
-        
-        # Create a CLI runner
-        self.runner = CliRunner()
-        
-        # Patch the TodoStore to use our temporary file
-        self.patcher = patch('todo.cli.store', TodoStore(self.temp_file.name))
-        self.mock_store = self.patcher.start()
-        
-    def tearDown(self):
-        """Clean up after tests."""
-        self.patcher.stop()
-        os.unlink(self.temp_file.name)
+_ALL_SEEDED = ['High priority task', 'Medium priority task', 'Completed low priority task']
+
+# (list flags, descriptions expected in the output) for the seeded store
+LIST_FILTER_CASES = [
+    ([], _ALL_SEEDED),
+    (['--completed'], ['Completed low priority task']),
+    (['--pending'], ['High priority task', 'Medium priority task']),
+    (['--file', 'test.py'], ['Medium priority task']),
+]
+
+
+def _seeded_prototype(descriptions, completed=False) -> InMemoryTodoStore:
+    """Build a store holding one todo per description, optionally all completed."""
+    store = InMemoryTodoStore()
+    for description in descriptions:
+        item = store.add(Todo(description=description))
+        if completed:
+            store.mark_complete(item.id)
+    return store
+
+
+# Built once; tests that use them work on a copy
+_THREE_PENDING = _seeded_prototype(["Task 1", "Task 2", "Task 3"])
+_THREE_COMPLETED = _seeded_prototype(
+    ["Completed Task 1", "Completed Task 2", "Completed Task 3"], completed=True
+)
+
+
+def _capture(command, **kwargs) -> str:
+    """Call a command's callback directly and return what it printed.
+
+    Skips Click's argument parsing and output redirection, for tests that
+    only care about the command's behaviour and messages.
+    """
+    orig_console = todo.cli.console
+    buffer = io.StringIO()
+    todo.cli.console = quiet_console(buffer)
+    try:
+        command.callback(**kwargs)
+    finally:
+        todo.cli.console = orig_console
+    return buffer.getvalue()
+
+
+_orig_console = todo.cli.console
+
+
+def setUpModule():
+    """Install a quiet console and render one listing up front.
+
+    The warm-up keeps Rich's lazy setup from being charged to the first test.
+    """
+    todo.cli.console = quiet_console()
+    orig_store = todo.cli.store
+    todo.cli.store = copy.copy(EMPTY_STORE)
+    todo.cli.store.add(Todo(description="Warm-up"))
+    try:
+        CLI_RUNNER.invoke(cli, ['l'], catch_exceptions=False)
+    finally:
+        todo.cli.store = orig_store
+
+
+def tearDownModule():
+    """Restore the CLI's own console."""
+    todo.cli.console = _orig_console
+
+
+class TestCli(CliTestCase):
+    def _seed(self, pending=(), completed=()):
+        """Add pending todos, then completed ones, and return them in that order."""
+        added = [self.mock_store.add(Todo(description=d)) for d in pending]
+        for description in completed:
+            item = self.mock_store.add(Todo(description=description))
+            added.append(self.mock_store.mark_complete(item.id))
+        return added
+
+    def _use_store(self, prototype):
+        """Replace this test's store with a private deep copy of a seeded prototype."""
+        self.mock_store = copy.deepcopy(prototype)
+        todo.cli.store = self.mock_store
+        return self.mock_store
+
+    def _invoke(self, args, **kwargs):
+        """Invoke the CLI without Click's standalone SystemExit handling.
+
+        Only for invocations expected to succeed; error paths that check a
+        non-zero exit code go through self.runner.invoke directly.
+        """
+        return self.runner.invoke(cli, args, standalone_mode=False, **kwargs)
+
+    def _descriptions(self, status=None):
+        """Return the descriptions of stored todos, optionally filtered by status."""
+        return [t.description for t in self.mock_store.filter(status=status)]
+
+    def _assert_has_todo(self, description, status=None):
+        """Assert the store holds a todo with this description (and status, if given)."""
+        self.assertIn(description, self._descriptions(status))
     
     def test_add_todo(self):
         """Test adding a todo."""
-        result = self.runner.invoke(cli, ['a', 'Test todo'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Added todo', result.output)
+        output = _capture(add, description='Test todo', file_path=None, priority='medium')
+        self.assertIn('Added todo', output)
         
         # Check with priority and file
-        result = self.runner.invoke(cli, ['a', 'Test with options', '-p', 'high', '-f', 'test.py'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Added todo', result.output)
-        
-        # Verify todos were added by listing them
-        result = self.runner.invoke(cli, ['l'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Test todo', result.output)
-        self.assertIn('Test with options', result.output)
-        self.assertIn('high', result.output)
-        self.assertIn('test.py', result.output)
+        output = _capture(add, description='Test with options', file_path='test.py', priority='high')
+        self.assertIn('Added todo', output)
+        
+        # Verify todos were added to the store
+        self._assert_has_todo('Test todo')
+        self._assert_has_todo('Test with options')
+        added = self.mock_store.get_all()[1]
+        self.assertEqual(added.priority, Priority.HIGH)
+        self.assertEqual(added.file_path, 'test.py')
     
-    def test_list_todos(self):
-        """Test listing todos with different filters."""
-        # Add some test todos
-        self.mock_store.add(Todo(description="Pending task 1"))
-        self.mock_store.add(Todo(description="Pending task 2", file_path="file.py"))
-        
-        completed = Todo(description="Completed task")
-        completed.mark_complete()
-        self.mock_store.add(completed)
-        
-        # Test basic listing
-        result = self.runner.invoke(cli, ['l'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Pending task 1', result.output)
-        self.assertIn('Pending task 2', result.output)
-        self.assertIn('Completed task', result.output)
-        
-        # Test filtering by status
-        result = self.runner.invoke(cli, ['l', '--completed'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertNotIn('Pending task', result.output)
-        self.assertIn('Completed task', result.output)
-        
-        result = self.runner.invoke(cli, ['l', '--pending'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Pending task', result.output)
-        self.assertNotIn('Completed task', result.output)
-        
-        # Test filtering by file
-        result = self.runner.invoke(cli, ['l', '--file', 'file.py'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertNotIn('Pending task 1', result.output)
-        self.assertIn('Pending task 2', result.output)
-        self.assertNotIn('Completed task', result.output)
+    def test_add_to_full_store(self):
+        """Test that a store error is reported and exits non-zero."""
+        self.mock_store._free_ids = 0
+        
+        result = self.runner.invoke(cli, ['a', 'One too many'])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn('Error adding todo', result.output)
+        self.assertIn('Maximum number of todos (100) reached', result.output)
     
     def test_complete_todo(self):
         """Test completing a todo."""
         todo = self.mock_store.add(Todo(description="Task to complete"))
         
-        result = self.runner.invoke(cli, ['c', todo.id])
+        result = self._invoke(['c', todo.id])
         self.assertEqual(result.exit_code, 0)
         # Check for partial string matches instead of exact match
         self.assertIn('Completed', result.output)
         self.assertIn('Task to complete', result.output)
         
         # Verify it's marked as completed
-        result = self.runner.invoke(cli, ['l', '--completed'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Task to complete', result.output)
+        self._assert_has_todo('Task to complete', Status.COMPLETED)
         
         # Test completing non-existent todo
         result = self.runner.invoke(cli, ['c', 'non-existent-id'])
@@ -105,73 +159,43 @@ class TestCli(unittest.TestCase):
     def test_mark_pending_todo(self):
         """Test marking a todo as pending."""
         # First add and complete a todo
-        todo = self.mock_store.add(Todo(description="Task to mark pending"))
-        self.mock_store.mark_complete(todo.id)
+        todo, = self._seed(completed=["Task to mark pending"])
         
         # Verify it's completed
-        result = self.runner.invoke(cli, ['l', '--completed'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Task to mark pending', result.output)
+        self._assert_has_todo('Task to mark pending', Status.COMPLETED)
         
         # Mark as pending
-        result = self.runner.invoke(cli, ['p', todo.id])
+        result = self._invoke(['p', todo.id])
         self.assertEqual(result.exit_code, 0)
         self.assertIn('pending', result.output.lower())
         self.assertIn('Task to mark pending', result.output)
+        self._assert_has_todo('Task to mark pending', Status.PENDING)
     
     def test_complete_multiple_todos(self):
         """Test completing multiple todos by ID."""
-        # Add multiple todos
-        todo1 = self.mock_store.add(Todo(description="Task 1"))
-        todo2 = self.mock_store.add(Todo(description="Task 2"))
-        todo3 = self.mock_store.add(Todo(description="Task 3"))
+        # Start from three pending todos
+        todo1, todo2, todo3 = self._use_store(_THREE_PENDING).get_all()
         
         # Complete multiple todos
-        result = self.runner.invoke(cli, ['c', todo1.id, todo2.id])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('2 todos as completed', result.output)
-        
-        # Verify they're completed
-        result = self.runner.invoke(cli, ['l', '--completed'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Task 1', result.output)
-        self.assertIn('Task 2', result.output)
+        output = _capture(complete, todo_ids=(todo1.id, todo2.id), all=False)
+        self.assertIn('2 todos as completed', output)
         
-        # Verify the third one is still pending
-        result = self.runner.invoke(cli, ['l', '--pending'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Task 3', result.output)
-        self.assertNotIn('Task 1', result.output)
-        self.assertNotIn('Task 2', result.output)
+        # Verify they're completed and the third one is still pending
+        self.assertEqual(self._descriptions(Status.COMPLETED), ['Task 1', 'Task 2'])
+        self.assertEqual(self._descriptions(Status.PENDING), ['Task 3'])
     
     def test_pending_multiple_todos(self):
         """Test marking multiple todos as pending."""
-        # Add and complete multiple todos
-        todo1 = self.mock_store.add(Todo(description="Completed Task 1"))
-        todo2 = self.mock_store.add(Todo(description="Completed Task 2"))
-        todo3 = self.mock_store.add(Todo(description="Completed Task 3"))
-        
-        self.mock_store.mark_complete(todo1.id)
-        self.mock_store.mark_complete(todo2.id)
-        self.mock_store.mark_complete(todo3.id)
+        # Start from three completed todos
+        todo1, todo2, todo3 = self._use_store(_THREE_COMPLETED).get_all()
         
         # Mark multiple todos as pending
-        result = self.runner.invoke(cli, ['p', todo1.id, todo2.id])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('2 todos as pending', result.output)
+        output = _capture(pending, todo_ids=(todo1.id, todo2.id), all=False)
+        self.assertIn('2 todos as pending', output)
         
-        # Verify they're pending
-        result = self.runner.invoke(cli, ['l', '--pending'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Completed Task 1', result.output)
-        self.assertIn('Completed Task 2', result.output)
-        
-        # Verify the third one is still completed
-        result = self.runner.invoke(cli, ['l', '--completed'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Completed Task 3', result.output)
-        self.assertNotIn('Completed Task 1', result.output)
-        self.assertNotIn('Completed Task 2', result.output)
+        # Verify they're pending and the third one is still completed
+        self.assertEqual(self._descriptions(Status.PENDING), ['Completed Task 1', 'Completed Task 2'])
+        self.assertEqual(self._descriptions(Status.COMPLETED), ['Completed Task 3'])
         
         # Test marking non-existent todo as pending
         result = self.runner.invoke(cli, ['p', 'non-existent-id'])
@@ -189,7 +213,7 @@ class TestCli(unittest.TestCase):
             file_path="important.py"
         ))
         
-        result = self.runner.invoke(cli, ['s', todo.id])
+        result = self._invoke(['s', todo.id])
         self.assertEqual(result.exit_code, 0)
         self.assertIn('Detailed task', result.output)
         self.assertIn('high', result.output)
@@ -205,14 +229,13 @@ class TestCli(unittest.TestCase):
         todo = self.mock_store.add(Todo(description="Task to erase"))
         
         # Test with confirmation (automatically saying yes)
-        result = self.runner.invoke(cli, ['e', todo.id], input='y\n')
+        result = self._invoke(['e', todo.id], input='y\n')
         self.assertEqual(result.exit_code, 0)
         self.assertIn('Erased', result.output)
         self.assertIn('Task to erase', result.output)
         
         # Verify it's gone
-        result = self.runner.invoke(cli, ['l'])
-        self.assertNotIn('Task to erase', result.output)
+        self.assertIsNone(self.mock_store.get(todo.id))
         
         # Test erasing multiple todos at once
         todo1 = self.mock_store.add(Todo(description="Todo 1"))
@@ -220,226 +243,192 @@ class TestCli(unittest.TestCase):
         todo3 = self.mock_store.add(Todo(description="Todo 3"))
         
         # Erase two of them
-        result = self.runner.invoke(cli, ['e', todo1.id, todo2.id, '--force'])
+        result = self._invoke(['e', todo1.id, todo2.id, '--force'])
         self.assertEqual(result.exit_code, 0)
         self.assertIn('Erased', result.output)
         self.assertIn('2', result.output)
         self.assertIn('todos', result.output)
         
         # Verify only todo3 remains
-        result = self.runner.invoke(cli, ['l'])
-        self.assertNotIn('Todo 1', result.output)
-        self.assertNotIn('Todo 2', result.output)
-        self.assertIn('Todo 3', result.output)
+        self.assertEqual([t.id for t in self.mock_store.get_all()], [todo3.id])
         
         # Test erasing all todos
-        result = self.runner.invoke(cli, ['e', '--all', '--force'])
+        result = self._invoke(['e', '--all', '--force'])
         self.assertEqual(result.exit_code, 0)
         self.assertIn('Erased', result.output)
         
         # Verify all todos are gone
-        result = self.runner.invoke(cli, ['l'])
-        self.assertIn('No todos found', result.output)
+        self.assertEqual(self.mock_store.get_all(), [])
 
 
     def test_modify_priority(self):
         """Test modifying todo priorities."""
-        # Add some test todos
-        self.runner.invoke(cli, ['a', 'Todo 1', '-p', 'low'])
-        self.runner.invoke(cli, ['a', 'Todo 2', '-p', 'medium'])
-        self.runner.invoke(cli, ['a', 'Todo 3', '-p', 'high'])
-        
-        # List todos to get their IDs
-        list_result = self.runner.invoke(cli, ['l'])
-        self.assertEqual(list_result.exit_code, 0)
+        # Add some test todos (IDs 0, 1 and 2)
+        self.mock_store.add(Todo(description="Todo 1", priority=Priority.LOW))
+        self.mock_store.add(Todo(description="Todo 2", priority=Priority.MEDIUM))
+        self.mock_store.add(Todo(description="Todo 3", priority=Priority.HIGH))
         
         # Modify a single todo's priority
-        result = self.runner.invoke(cli, ['m', '0', '-p', 'high'])
+        result = self._invoke(['m', '0', '-p', 'high'])
         self.assertEqual(result.exit_code, 0)
         self.assertIn('Updated priority to high', result.output)
         
         # Verify the priority was changed
-        show_result = self.runner.invoke(cli, ['s', '0'])
-        self.assertEqual(show_result.exit_code, 0)
-        self.assertIn('Priority: high', show_result.output)
+        self.assertEqual(self.mock_store.get('0').priority, Priority.HIGH)
         
         # Modify multiple todos at once
-        result = self.runner.invoke(cli, ['m', '1', '2', '-p', 'low'])
+        result = self._invoke(['m', '1', '2', '-p', 'low'])
         self.assertEqual(result.exit_code, 0)
         self.assertIn('Updated priority to low for 2 todos', result.output)
         
         # Verify all priorities were changed
-        show_result = self.runner.invoke(cli, ['s', '1'])
-        self.assertEqual(show_result.exit_code, 0)
-        self.assertIn('Priority: low', show_result.output)
-        
-        show_result = self.runner.invoke(cli, ['s', '2'])
-        self.assertEqual(show_result.exit_code, 0)
-        self.assertIn('Priority: low', show_result.output)
+        self.assertEqual(self.mock_store.get('1').priority, Priority.LOW)
+        self.assertEqual(self.mock_store.get('2').priority, Priority.LOW)
         
         # Test modifying all todos
-        result = self.runner.invoke(cli, ['m', '-a', '-p', 'medium'])
+        result = self._invoke(['m', '-a', '-p', 'medium'])
         self.assertEqual(result.exit_code, 0)
         self.assertIn('Updated priority to medium for', result.output)
         
         # Verify all priorities were changed to medium
-        list_result = self.runner.invoke(cli, ['l'])
-        self.assertEqual(list_result.exit_code, 0)
-        self.assertNotIn('high', list_result.output)
-        self.assertNotIn('low', list_result.output)
-        
-    def test_shorthand_priority(self):
-        """Test using shorthand priority options (h, m, l)."""
-        # Test adding with shorthand priorities
-        result = self.runner.invoke(cli, ['a', 'High priority todo', '-p', 'h'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Added todo', result.output)
-        self.assertIn('high', result.output)
-        
-        result = self.runner.invoke(cli, ['a', 'Medium priority todo', '-p', 'm'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Added todo', result.output)
-        self.assertIn('medium', result.output)
-        
-        result = self.runner.invoke(cli, ['a', 'Low priority todo', '-p', 'l'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Added todo', result.output)
-        self.assertIn('low', result.output)
-        
-        # Test modifying with shorthand priorities
-        # First, get the IDs
-        list_result = self.runner.invoke(cli, ['l'])
-        self.assertEqual(list_result.exit_code, 0)
-        
-        # Modify a todo from high to low using shorthand
-        result = self.runner.invoke(cli, ['m', '0', '-p', 'l'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Updated priority to low', result.output)
-        
-        # Verify the change
-        show_result = self.runner.invoke(cli, ['s', '0'])
-        self.assertEqual(show_result.exit_code, 0)
-        self.assertIn('Priority: low', show_result.output)
+        self.assertEqual(
+            [t.priority for t in self.mock_store.get_all()],
+            [Priority.MEDIUM] * 3
+        )
+        
+    def test_add_shorthand_priority(self):
+        """Test adding todos with shorthand priority options (h, m, l)."""
+        for short, full in SHORTHAND_PRIORITIES:
+            with self.subTest(priority=short):
+                result = self._invoke(['a', f'{full.title()} priority todo', '-p', short])
+                self.assertEqual(result.exit_code, 0)
+                self.assertIn('Added todo', result.output)
+                self.assertIn(full, result.output)
+    
+    def test_modify_shorthand_priority(self):
+        """Test modifying a todo with shorthand priority options (h, m, l)."""
+        todo, = self._seed(pending=["Todo to modify"])
+        
+        for short, full in SHORTHAND_PRIORITIES:
+            with self.subTest(priority=short):
+                result = self._invoke(['m', todo.id, '-p', short])
+                self.assertEqual(result.exit_code, 0)
+                self.assertIn(f'Updated priority to {full}', result.output)
+                self.assertEqual(self.mock_store.get(todo.id).priority, Priority(full))
     
     def test_complete_all_todos(self):
         """Test completing all pending todos with --all flag."""
-        # Add multiple todos with different statuses
-        todo1 = self.mock_store.add(Todo(description="Pending Task 1"))
-        todo2 = self.mock_store.add(Todo(description="Pending Task 2"))
-        todo3 = self.mock_store.add(Todo(description="Already Completed"))
-        
-        # Mark one as completed already
-        self.mock_store.mark_complete(todo3.id)
+        # Add two pending todos and one that is already completed
+        self._seed(pending=["Pending Task 1", "Pending Task 2"], completed=["Already Completed"])
         
         # Complete all pending todos
-        result = self.runner.invoke(cli, ['c', '--all'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('2 todos as completed', result.output)
-        
-        # Verify all todos are now completed
-        result = self.runner.invoke(cli, ['l', '--completed'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Pending Task 1', result.output)
-        self.assertIn('Pending Task 2', result.output)
-        self.assertIn('Already Completed', result.output)
-        
-        # Verify no pending todos remain
-        result = self.runner.invoke(cli, ['l', '--pending'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('No todos found', result.output)
+        output = _capture(complete, todo_ids=(), all=True)
+        self.assertIn('2 todos as completed', output)
+        
+        # Verify all todos are now completed and no pending todos remain
+        self.assertCountEqual(
+            self._descriptions(Status.COMPLETED),
+            ['Pending Task 1', 'Pending Task 2', 'Already Completed']
+        )
+        self.assertEqual(self._descriptions(Status.PENDING), [])
     
     def test_pending_all_todos(self):
         """Test marking all completed todos as pending with --all flag."""
-        # Add multiple todos and complete them
-        todo1 = self.mock_store.add(Todo(description="Completed Task 1"))
-        todo2 = self.mock_store.add(Todo(description="Completed Task 2"))
-        todo3 = self.mock_store.add(Todo(description="Still Pending"))
-        
-        self.mock_store.mark_complete(todo1.id)
-        self.mock_store.mark_complete(todo2.id)
+        # Add two completed todos and one that is still pending
+        self._seed(pending=["Still Pending"], completed=["Completed Task 1", "Completed Task 2"])
         
         # Mark all completed todos as pending
-        result = self.runner.invoke(cli, ['p', '--all'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('2 todos as pending', result.output)
-        
-        # Verify all todos are now pending
-        result = self.runner.invoke(cli, ['l', '--pending'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Completed Task 1', result.output)
-        self.assertIn('Completed Task 2', result.output)
-        self.assertIn('Still Pending', result.output)
-        
-        # Verify no completed todos remain
-        result = self.runner.invoke(cli, ['l', '--completed'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('No todos found', result.output)
+        output = _capture(pending, todo_ids=(), all=True)
+        self.assertIn('2 todos as pending', output)
+        
+        # Verify all todos are now pending and no completed todos remain
+        self.assertCountEqual(
+            self._descriptions(Status.PENDING),
+            ['Completed Task 1', 'Completed Task 2', 'Still Pending']
+        )
+        self.assertEqual(self._descriptions(Status.COMPLETED), [])
     
     def test_complete_with_mixed_valid_invalid_ids(self):
         """Test completing todos with a mix of valid and invalid IDs."""
         # Add a todo
-        todo1 = self.mock_store.add(Todo(description="Valid Task"))
+        todo1, = self._seed(pending=["Valid Task"])
         
         # Try to complete valid and invalid IDs
-        result = self.runner.invoke(cli, ['c', todo1.id, 'invalid-id'])
+        result = self._invoke(['c', todo1.id, 'invalid-id'])
         self.assertEqual(result.exit_code, 0)  # Should succeed for valid ID
         self.assertIn('not found: invalid-id', result.output)
         self.assertIn('Valid Task', result.output)
         
         # Verify the valid todo was completed
-        result = self.runner.invoke(cli, ['l', '--completed'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Valid Task', result.output)
+        self.assertEqual(self._descriptions(Status.COMPLETED), ['Valid Task'])
     
     def test_pending_with_mixed_valid_invalid_ids(self):
         """Test marking todos as pending with a mix of valid and invalid IDs."""
         # Add and complete a todo
-        todo1 = self.mock_store.add(Todo(description="Valid Completed Task"))
-        self.mock_store.mark_complete(todo1.id)
+        todo1, = self._seed(completed=["Valid Completed Task"])
         
         # Try to mark valid and invalid IDs as pending
-        result = self.runner.invoke(cli, ['p', todo1.id, 'invalid-id'])
+        result = self._invoke(['p', todo1.id, 'invalid-id'])
         self.assertEqual(result.exit_code, 0)  # Should succeed for valid ID
         self.assertIn('not found: invalid-id', result.output)
         self.assertIn('Valid Completed Task', result.output)
         
         # Verify the valid todo was marked as pending
-        result = self.runner.invoke(cli, ['l', '--pending'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Valid Completed Task', result.output)
-    
-    def test_complete_no_args_shows_help(self):
-        """Test that complete command without args shows helpful message."""
-        result = self.runner.invoke(cli, ['c'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Please specify either todo ID(s) or use the --all flag', result.output)
-    
-    def test_pending_no_args_shows_help(self):
-        """Test that pending command without args shows helpful message."""
-        result = self.runner.invoke(cli, ['p'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('Please specify either todo ID(s) or use the --all flag', result.output)
+        self.assertEqual(self._descriptions(Status.PENDING), ['Valid Completed Task'])
     
     def test_complete_all_with_no_pending_todos(self):
         """Test completing all todos when no pending todos exist."""
         # Add and complete a todo
-        todo1 = self.mock_store.add(Todo(description="Already Completed"))
-        self.mock_store.mark_complete(todo1.id)
+        self._seed(completed=["Already Completed"])
         
         # Try to complete all pending todos
-        result = self.runner.invoke(cli, ['c', '--all'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('No pending todos to complete', result.output)
+        output = _capture(complete, todo_ids=(), all=True)
+        self.assertIn('No pending todos to complete', output)
     
     def test_pending_all_with_no_completed_todos(self):
         """Test marking all todos as pending when no completed todos exist."""
         # Add a pending todo
-        todo1 = self.mock_store.add(Todo(description="Still Pending"))
+        self._seed(pending=["Still Pending"])
         
         # Try to mark all completed todos as pending
-        result = self.runner.invoke(cli, ['p', '--all'])
-        self.assertEqual(result.exit_code, 0)
-        self.assertIn('No completed todos to mark as pending', result.output)
+        output = _capture(pending, todo_ids=(), all=True)
+        self.assertIn('No completed todos to mark as pending', output)
+
+
+class TestCliReadOnly(SharedStoreCliTestCase):
+    """Commands that never modify the store, sharing one empty store across tests."""
+
+    def test_complete_no_args_shows_help(self):
+        """Test that complete command without args shows helpful message."""
+        output = _capture(complete, todo_ids=(), all=False)
+        self.assertIn('Please specify either todo ID(s) or use the --all flag', output)
+    
+    def test_pending_no_args_shows_help(self):
+        """Test that pending command without args shows helpful message."""
+        output = _capture(pending, todo_ids=(), all=False)
+        self.assertIn('Please specify either todo ID(s) or use the --all flag', output)
+
+
+class TestListFilters(SharedStoreCliTestCase):
+    """List filters, all reading the seeded store built once for the class."""
+
+    @classmethod
+    def build_store(cls) -> InMemoryTodoStore:
+        """Share a copy of the seeded three-todo store."""
+        return copy.deepcopy(SEEDED_STORE)
+
+    def test_list_todos(self):
+        """Test listing todos with different filters."""
+        for flags, expected in LIST_FILTER_CASES:
+            with self.subTest(flags=flags):
+                result = self.runner.invoke(cli, ['l', *flags], standalone_mode=False)
+                self.assertEqual(result.exit_code, 0)
+                for description in _ALL_SEEDED:
+                    if description in expected:
+                        self.assertIn(description, result.output)
+                    else:
+                        self.assertNotIn(description, result.output)
+
 
 if __name__ == "__main__":
     unittest.main()
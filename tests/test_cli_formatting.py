@@ -1,52 +1,94 @@
 """Tests for the CLI formatting functionality."""
+import copy
 import os
-import tempfile
+import time
 import unittest
-from unittest.mock import patch
-from click.testing import CliRunner
+from unittest import mock
 
-from todo.cli import cli
-from todo.models import Todo, TodoStore, Priority, Status
+from rich.text import Text
 
+import todo.cli
+from todo.cli import cli, render_todos
+from todo.models import Todo, Priority, Status
+from tests.support import (
+    SEEDED_STORE, CliTestCase, InMemoryTodoStore, SharedStoreCliTestCase,
+    quiet_console,
+)
 
-class TestCliFormatting(unittest.TestCase):
-    def setUp(self):
-        """Set up a test environment."""
-        # Create a temporary file for the todo store
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.temp_file.close()
-        
-        # Create a CLI runner
-        self.runner = CliRunner()
-        
-        # Patch the TodoStore to use our temporary file
-        self.store_patcher = patch('todo.cli.store', TodoStore(self.temp_file.name))
-        self.mock_store = self.store_patcher.start()
-        
-    def tearDown(self):
-        """Clean up after tests."""
-        self.store_patcher.stop()
-        os.unlink(self.temp_file.name)
+_orig_console = todo.cli.console
+
+
+def setUpModule():
+    """Render through a console with colour switched off."""
+    todo.cli.console = quiet_console()
+
+
+def tearDownModule():
+    """Restore the CLI's own console."""
+    todo.cli.console = _orig_console
+
+
+class TestCliFormatting(CliTestCase):
+    def test_truncation(self):
+        """Test that long descriptions are truncated in list view."""
+        # Add a todo with a very long description
+        long_desc = "This is a very long description that should be truncated in the list view " * 10
+        self.mock_store.add(Todo(description=long_desc))
+        
+        # Call the command
+        result = self.runner.invoke(cli, ['l'])
+        
+        # Check output
+        self.assertEqual(result.exit_code, 0)
+        output = result.output
+        
+        # Verify the description is truncated
+        self.assertIn("…", output)
+        # The full description should not appear in the output
+        self.assertNotIn(long_desc, output)
+    
+    def test_markup_like_text_listed_verbatim(self):
+        """Test that brackets in descriptions, file paths and IDs are printed, not parsed."""
+        self.mock_store.add(Todo(description="fix [/] parser", file_path="src/[bold]x.py"))
+        
+        result = self.runner.invoke(cli, ['l'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("fix [/] parser", result.output)
+        self.assertIn("src/[bold]x.py", result.output)
+        
+        result = self.runner.invoke(cli, ['c', '[/x]'])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("Todo(s) not found: [/x]", result.output)
     
+    def test_empty_list(self):
+        """Test formatting when no todos are found."""
+        # Call the command with an empty store
+        result = self.runner.invoke(cli, ['l'])
+        
+        # Check output
+        self.assertEqual(result.exit_code, 0)
+        output = result.output
+        
+        # Verify the "no todos" message
+        self.assertIn("No todos found", output)
+
+
+class TestPrepopulatedFormatting(SharedStoreCliTestCase):
+    """Rendering checks that only read a store built once for the whole class."""
+
+    @classmethod
+    def build_store(cls) -> InMemoryTodoStore:
+        """Build the store shared by the rendering checks."""
+        store = copy.deepcopy(SEEDED_STORE)
+        cls.detailed = store.add(Todo(
+            description="Detailed task view",
+            priority=Priority.HIGH,
+            file_path="important.py"
+        ))
+        return store
+
     def test_list_formatting(self):
         """Test that list_todos formats output correctly."""
-        # Add some test todos
-        self.mock_store.add(Todo(
-            description="High priority task",
-            priority=Priority.HIGH
-        ))
-        self.mock_store.add(Todo(
-            description="Medium priority task",
-            priority=Priority.MEDIUM,
-            file_path="test.py"
-        ))
-        completed = Todo(
-            description="Completed low priority task",
-            priority=Priority.LOW
-        )
-        completed.mark_complete()
-        self.mock_store.add(completed)
-        
         # Call the command
         result = self.runner.invoke(cli, ['l'])
         
@@ -67,17 +109,29 @@ class TestCliFormatting(unittest.TestCase):
         # Verify file path is shown
         self.assertIn("test.py", output)
     
+    def test_render_todos(self):
+        """Test that render_todos builds one row per todo, in the order given."""
+        todos = [self.shared_store.get(todo_id) for todo_id in ("2", "0", "1")]
+        table = render_todos(todos)
+        
+        self.assertEqual(table.row_count, 3)
+        status, ids, descriptions, priorities, files = (
+            list(column.cells) for column in table.columns
+        )
+        self.assertEqual(ids, ["2", "0", "1"])
+        self.assertEqual(status, ["✓", " ", " "])
+        self.assertEqual(descriptions, [
+            "Completed low priority task",
+            "High priority task",
+            "Medium priority task",
+        ])
+        self.assertEqual([Text.from_markup(p).plain for p in priorities], ["🟢 low", "🔴 high", "🟡 medium"])
+        self.assertEqual(files, ["", "", "test.py"])
+    
     def test_show_formatting(self):
         """Test that show formats output correctly."""
-        # Add a test todo
-        todo = self.mock_store.add(Todo(
-            description="Detailed task view",
-            priority=Priority.HIGH,
-            file_path="important.py"
-        ))
-        
         # Call the command
-        result = self.runner.invoke(cli, ['s', todo.id])
+        result = self.runner.invoke(cli, ['s', self.detailed.id])
         
         # Check output
         self.assertEqual(result.exit_code, 0)
@@ -89,35 +143,21 @@ class TestCliFormatting(unittest.TestCase):
         self.assertIn("important.py", output)
         self.assertIn("Todo Details", output)  # Panel title
     
-    def test_truncation(self):
-        """Test that long descriptions are truncated in list view."""
-        # Add a todo with a very long description
-        long_desc = "This is a very long description that should be truncated in the list view " * 10
-        self.mock_store.add(Todo(description=long_desc))
+    @unittest.skipUnless(hasattr(time, "tzset"), "needs time.tzset to pin the local timezone")
+    def test_show_dates(self):
+        """Test that show prints timestamps in local time, to the minute."""
+        # Pin local time to UTC; the cleanups run in reverse, restoring TZ first
+        self.addCleanup(time.tzset)
+        tz_patch = mock.patch.dict(os.environ, {"TZ": "UTC"})
+        tz_patch.start()
+        self.addCleanup(tz_patch.stop)
+        time.tzset()
+        
+        result = self.runner.invoke(cli, ['s', '2'])
         
-        # Call the command
-        result = self.runner.invoke(cli, ['l'])
-        
-        # Check output
-        self.assertEqual(result.exit_code, 0)
-        output = result.output
-        
-        # Verify the description is truncated
-        self.assertIn("...", output)
-        # The full description should not appear in the output
-        self.assertNotIn(long_desc, output)
-    
-    def test_empty_list(self):
-        """Test formatting when no todos are found."""
-        # Call the command with an empty store
-        result = self.runner.invoke(cli, ['l'])
-        
-        # Check output
         self.assertEqual(result.exit_code, 0)
-        output = result.output
-        
-        # Verify the "no todos" message
-        self.assertIn("No todos found", output)
+        self.assertIn("Created: 2025-06-17 09:12", result.output)
+        self.assertIn("Completed: 2025-06-18 12:51", result.output)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,24 @@
+import contextlib
+import copy
+import io
 import os
 import tempfile
+import time
 import unittest
+from unittest import mock
 from datetime import datetime
+from todo import models
 from todo.models import Todo, TodoStore, Priority, Status
+from tests.support import FIXTURES_DIR, SEEDED_STORE, InMemoryTodoStore, load_fixture
+
+
+# (starts completed, action, expected status) for Todo and TodoStore status changes
+STATUS_TRANSITIONS = [
+    (False, "mark_complete", Status.COMPLETED),
+    (True, "mark_complete", Status.COMPLETED),
+    (False, "mark_pending", Status.PENDING),
+    (True, "mark_pending", Status.PENDING),
+]
 
 
 class TestTodo(unittest.TestCase):
@@ -29,67 +45,111 @@ class TestTodo(unittest.TestCase):
         self.assertEqual(todo.file_path, "test.py")
         self.assertEqual(todo.id, "custom-id")
 
-    def test_mark_complete(self):
-        """Test marking a todo as completed."""
-        todo = Todo(description="Test todo")
-        self.assertEqual(todo.status, Status.PENDING)
-        self.assertIsNone(todo.completed_at)
-        
-        todo.mark_complete()
-        self.assertEqual(todo.status, Status.COMPLETED)
-        self.assertIsNotNone(todo.completed_at)
-        
-        # Verify completed_at is a valid ISO format date
-        try:
-            datetime.fromisoformat(todo.completed_at)
-        except ValueError:
-            self.fail("completed_at is not a valid ISO format date")
-            
-    def test_mark_pending(self):
-        """Test marking a todo as pending."""
-        # First mark as completed
-        todo = Todo(description="Test todo")
-        todo.mark_complete()
-        self.assertEqual(todo.status, Status.COMPLETED)
-        self.assertIsNotNone(todo.completed_at)
-        
-        # Then mark as pending
-        todo.mark_pending()
-        self.assertEqual(todo.status, Status.PENDING)
-        self.assertIsNone(todo.completed_at)
+    def test_status_transitions(self):
+        """Test marking a todo as completed or pending from either state."""
+        for starts_completed, action, expected in STATUS_TRANSITIONS:
+            with self.subTest(starts_completed=starts_completed, action=action):
+                todo = Todo(description="Test todo")
+                if starts_completed:
+                    todo.mark_complete()
+                
+                getattr(todo, action)()
+                self.assertEqual(todo.status, expected)
+                if expected == Status.PENDING:
+                    self.assertIsNone(todo.completed_at)
+                else:
+                    # Verify completed_at is epoch microseconds, not before creation
+                    self.assertIsInstance(todo.completed_at, int)
+                    self.assertGreaterEqual(todo.completed_at, todo.created_at)
+
 
-    def test_todo_serialization(self):
-        """Test converting Todo to and from dict."""
-        original = Todo(
+class TestTodoSerialization(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Serialize a Todo once and restore it for all assertions."""
+        cls.original = Todo(
             description="Serialize me",
             priority=Priority.LOW,
             file_path="data.json"
         )
-        
-        # Convert to dict
-        todo_dict = original.to_dict()
-        self.assertEqual(todo_dict["description"], "Serialize me")
-        self.assertEqual(todo_dict["priority"], "low")
-        self.assertEqual(todo_dict["file_path"], "data.json")
-        
-        # Convert back to Todo
-        restored = Todo.from_dict(todo_dict)
-        self.assertEqual(restored.description, original.description)
-        self.assertEqual(restored.priority, original.priority)
-        self.assertEqual(restored.file_path, original.file_path)
-        self.assertEqual(restored.id, original.id)
+        cls.todo_dict = cls.original.to_dict()
+        cls.restored = Todo.from_dict(cls.todo_dict)
+
+    def test_dict_fields(self):
+        """Test converting Todo to dict."""
+        self.assertEqual(self.todo_dict["description"], "Serialize me")
+        self.assertEqual(self.todo_dict["priority"], "low")
+        self.assertEqual(self.todo_dict["file_path"], "data.json")
+        # Plain strings, not enum members
+        self.assertIs(type(self.todo_dict["priority"]), str)
+        self.assertIs(type(self.todo_dict["status"]), str)
+
+    def test_from_dict_defaults(self):
+        """Test that keys missing from a dict fall back to the field defaults."""
+        todo = Todo.from_dict({"description": "Minimal"})
+        self.assertIs(todo.priority, Priority.MEDIUM)
+        self.assertIs(todo.status, Status.PENDING)
+        self.assertIsNone(todo.file_path)
+        self.assertIsNone(todo.completed_at)
+        self.assertIsInstance(todo.created_at, int)
+
+    def test_from_dict_unknown_enum_value(self):
+        """Test that an unrecognised priority or status is rejected with ValueError."""
+        for key in ("priority", "status"):
+            with self.subTest(key=key):
+                with self.assertRaises(ValueError):
+                    Todo.from_dict({"description": "Bad", key: "urgent"})
+
+    def test_from_dict_iso_timestamps(self):
+        """Test that ISO-8601 timestamps from older files load as epoch microseconds."""
+        todo = Todo.from_dict({
+            "description": "Old format",
+            "created_at": "2025-06-17T09:12:03.118204",
+            "completed_at": "2025-06-18T12:51:11.516470",
+        })
+        self.assertEqual(
+            datetime.fromtimestamp(todo.created_at / 1_000_000),
+            datetime(2025, 6, 17, 9, 12, 3, 118204)
+        )
+        self.assertEqual(
+            datetime.fromtimestamp(todo.completed_at / 1_000_000),
+            datetime(2025, 6, 18, 12, 51, 11, 516470)
+        )
+
+    def test_roundtrip_fields(self):
+        """Test that plain fields survive a round trip."""
+        self.assertEqual(self.restored.description, self.original.description)
+        self.assertEqual(self.restored.file_path, self.original.file_path)
+
+    def test_roundtrip_id(self):
+        """Test that the ID survives a round trip."""
+        self.assertEqual(self.restored.id, self.original.id)
+
+    def test_roundtrip_priority(self):
+        """Test that the priority comes back as the enum member."""
+        self.assertEqual(self.restored.priority, self.original.priority)
+        self.assertIs(self.restored.priority, Priority.LOW)
+
+    def test_fixtures_match_schema(self):
+        """Test that every committed fixture still matches what to_dict writes.
+
+        Seeded stores load these files as-is, so a field added to or renamed
+        on Todo has to be reflected in the fixtures as well.
+        """
+        for name in sorted(os.listdir(FIXTURES_DIR)):
+            if not name.endswith(".json"):
+                continue
+            for todo_id, todo_data in load_fixture(name).items():
+                with self.subTest(fixture=name, id=todo_id):
+                    restored = Todo.from_dict(todo_data)
+                    self.assertEqual(restored.to_dict(), todo_data)
+                    self.assertEqual(restored.id, todo_id)
 
 
 class TestTodoStore(unittest.TestCase):
     def setUp(self):
-        """Create a temporary file for testing storage."""
-        self.temp_file = tempfile.NamedTemporaryFile(delete=False)
-        self.temp_file.close()
-        self.store = TodoStore(self.temp_file.name)
-
-    def tearDown(self):
-        """Clean up the temporary file."""
-        os.unlink(self.temp_file.name)
+        """Create a store that keeps its data in memory."""
+        self.store = InMemoryTodoStore()
 
     def test_add_and_get(self):
         """Test adding and retrieving todos."""
@@ -137,68 +197,100 @@ class TestTodoStore(unittest.TestCase):
         result = self.store.remove("non-existent-id")
         self.assertFalse(result)
 
-    def test_mark_complete(self):
-        """Test marking a todo as completed."""
-        todo = self.store.add(Todo(description="To be completed"))
+    def test_status_transitions(self):
+        """Test marking stored todos as completed or pending from either state."""
+        for starts_completed, action, expected in STATUS_TRANSITIONS:
+            with self.subTest(starts_completed=starts_completed, action=action):
+                todo = self.store.add(Todo(description="To be updated"))
+                if starts_completed:
+                    self.store.mark_complete(todo.id)
+                
+                updated = getattr(self.store, action)(todo.id)
+                self.assertEqual(updated.status, expected)
+                self.assertEqual(updated.completed_at is None, expected == Status.PENDING)
+                
+                # Verify the store returns the updated todo
+                retrieved = self.store.get(todo.id)
+                self.assertEqual(retrieved.status, expected)
         
-        # Complete the todo
-        completed = self.store.mark_complete(todo.id)
-        self.assertEqual(completed.status, Status.COMPLETED)
-        self.assertIsNotNone(completed.completed_at)
+        # Try updating a non-existent todo
+        for action in ("mark_complete", "mark_pending"):
+            with self.subTest(action=action, todo_id="non-existent-id"):
+                self.assertIsNone(getattr(self.store, action)("non-existent-id"))
+
+    def test_batch_shares_timestamp(self):
+        """Test that todos created and completed in one batch share a timestamp."""
+        with self.store.batch():
+            first = self.store.add(Todo(description="First"))
+            time.sleep(0.002)
+            second = self.store.add(Todo(description="Second"))
+            self.store.mark_complete(first.id)
         
-        # Verify it's saved
-        retrieved = self.store.get(todo.id)
-        self.assertEqual(retrieved.status, Status.COMPLETED)
+        self.assertEqual(first.created_at, second.created_at)
+        self.assertEqual(first.completed_at, first.created_at)
         
-        # Try completing non-existent todo
-        result = self.store.mark_complete("non-existent-id")
-        self.assertIsNone(result)
+        # Outside a batch the clock moves again
+        time.sleep(0.002)
+        self.assertNotEqual(Todo(description="Later").created_at, first.created_at)
+
+    def test_id_allocation(self):
+        """Test that IDs 0-99 are handed out lowest first, and no further."""
+        ids = [self.store.add(Todo(description=f"Task {i}")).id for i in range(100)]
+        self.assertEqual(ids, [str(i) for i in range(100)])
+        with self.assertRaises(ValueError):
+            self.store.add(Todo(description="One too many"))
         
-    def test_mark_pending(self):
-        """Test marking a todo as pending."""
-        # First add and complete a todo
-        todo = self.store.add(Todo(description="To be marked pending"))
-        self.store.mark_complete(todo.id)
+        self.store.remove_many(["42", "7"])
+        self.assertEqual(self.store.add(Todo(description="Refill")).id, "7")
+        self.assertEqual(self.store.add(Todo(description="Refill")).id, "42")
+
+    def test_status_index_follows_changes(self):
+        """Test that status filters stay correct as todos change and go."""
+        self.store = copy.deepcopy(SEEDED_STORE)
         
-        # Verify it's completed
-        retrieved = self.store.get(todo.id)
-        self.assertEqual(retrieved.status, Status.COMPLETED)
-        self.assertIsNotNone(retrieved.completed_at)
+        self.store.mark_complete("0")
+        self.store.remove("2")
+        # Status changed on the object directly, then saved through update()
+        todo = self.store.get("1")
+        todo.mark_complete()
+        self.store.update(todo)
+        added = self.store.add(Todo(description="New"))
+        
+        self.assertCountEqual(
+            [t.id for t in self.store.filter(status=Status.COMPLETED)], ["0", "1"]
+        )
+        self.assertEqual([t.id for t in self.store.filter(status=Status.PENDING)], [added.id])
+
+    def test_bulk_operations(self):
+        """Test the *_many methods, which skip unknown IDs and save once."""
+        self.store = copy.deepcopy(SEEDED_STORE)
         
-        # Mark as pending
-        pending = self.store.mark_pending(todo.id)
-        self.assertEqual(pending.status, Status.PENDING)
-        self.assertIsNone(pending.completed_at)
+        completed = self.store.mark_complete_many(["0", "1", "missing"])
+        self.assertEqual([t.id for t in completed], ["0", "1"])
+        self.assertEqual(len(self.store.filter(status=Status.COMPLETED)), 3)
+        self.assertEqual(self.store._data["0"]["status"], "completed")
         
-        # Verify it's saved
-        retrieved = self.store.get(todo.id)
-        self.assertEqual(retrieved.status, Status.PENDING)
-        self.assertIsNone(retrieved.completed_at)
+        pending = self.store.mark_pending_many(["2", "missing"])
+        self.assertEqual([t.id for t in pending], ["2"])
+        self.assertEqual(self.store._data["2"]["status"], "pending")
         
-        # Try marking non-existent todo as pending
-        result = self.store.mark_pending("non-existent-id")
-        self.assertIsNone(result)
+        todo = self.store.get("1")
+        todo.priority = Priority.LOW
+        self.assertEqual(self.store.update_many([todo]), [todo])
+        self.assertEqual(self.store._data["1"]["priority"], "low")
+        with self.assertRaises(ValueError):
+            self.store.update_many([Todo(description="Not stored", id="missing")])
+        
+        self.assertEqual(self.store.remove_many(["0", "2", "missing"]), ["0", "2"])
+        self.assertEqual([t.id for t in self.store.get_all()], ["1"])
+        self.assertEqual(list(self.store._data), ["1"])
+        
+        # Freed IDs are handed out again
+        self.assertEqual(self.store.add(Todo(description="Reuses an ID")).id, "0")
 
     def test_filter(self):
         """Test filtering todos."""
-        # Add some todos with different statuses and file paths
-        self.store.add(Todo(
-            description="Pending task",
-            status=Status.PENDING,
-            file_path="file1.py"
-        ))
-        completed = Todo(
-            description="Completed task",
-            status=Status.PENDING,
-            file_path="file2.py"
-        )
-        completed.mark_complete()
-        self.store.add(completed)
-        self.store.add(Todo(
-            description="Another pending",
-            status=Status.PENDING,
-            file_path="file1.py"
-        ))
+        self.store = copy.deepcopy(SEEDED_STORE)
         
         # Filter by status
         pending = self.store.filter(status=Status.PENDING)
@@ -208,15 +300,35 @@ class TestTodoStore(unittest.TestCase):
         self.assertEqual(len(completed), 1)
         
         # Filter by file path
-        file1_todos = self.store.filter(file_path="file1.py")
-        self.assertEqual(len(file1_todos), 2)
+        test_py_todos = self.store.filter(file_path="test.py")
+        self.assertEqual(len(test_py_todos), 1)
         
         # Filter by both
-        pending_file1 = self.store.filter(
+        pending_test_py = self.store.filter(
             status=Status.PENDING,
-            file_path="file1.py"
+            file_path="test.py"
         )
-        self.assertEqual(len(pending_file1), 2)
+        self.assertEqual(len(pending_test_py), 1)
+        self.assertEqual(len(self.store.filter(
+            status=Status.COMPLETED,
+            file_path="test.py"
+        )), 0)
+
+
+
+class TestTodoStorePersistence(unittest.TestCase):
+    """The only store tests that read and write real files."""
+
+    def setUp(self):
+        """Create a temporary directory for testing storage."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.storage_path = os.path.join(self.temp_dir.name, "todos.json")
+        self.store = TodoStore(self.storage_path)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        self.store.close()
+        self.temp_dir.cleanup()
 
     def test_persistence(self):
         """Test that todos are saved to and loaded from disk."""
@@ -224,13 +336,230 @@ class TestTodoStore(unittest.TestCase):
         todo = self.store.add(Todo(description="Persistent"))
         
         # Create a new store instance with the same file
-        new_store = TodoStore(self.temp_file.name)
+        new_store = TodoStore(self.storage_path)
         
         # Verify the todo was loaded
         loaded = new_store.get(todo.id)
         self.assertIsNotNone(loaded)
         self.assertEqual(loaded.description, "Persistent")
 
+    def test_changes_are_logged(self):
+        """Test that changes are appended to the log and replayed on load."""
+        kept = self.store.add(Todo(description="Kept"))
+        dropped = self.store.add(Todo(description="Dropped"))
+        self.store.mark_complete(kept.id)
+        self.store.remove(dropped.id)
+        
+        # Nothing has been compacted into the snapshot yet
+        self.assertFalse(os.path.exists(self.storage_path))
+        with open(self.store.log_path, "rb") as f:
+            self.assertEqual(len(f.read().splitlines()), 4)
+        
+        with TodoStore(self.storage_path) as reloaded:
+            self.assertEqual([t.description for t in reloaded.get_all()], ["Kept"])
+            self.assertEqual(reloaded.get(kept.id).status, Status.COMPLETED)
+            self.assertEqual(reloaded.add(Todo(description="Reuses an ID")).id, dropped.id)
+
+    def test_unchanged_status_not_logged(self):
+        """Test that re-applying a todo's current status writes nothing."""
+        todo = self.store.add(Todo(description="Done once"))
+        self.store.mark_complete(todo.id)
+        completed_at = todo.completed_at
+        
+        self.store.mark_complete(todo.id)
+        self.store.mark_complete_many([todo.id])
+        # The original completion time is kept
+        self.assertEqual(todo.completed_at, completed_at)
+        
+        self.store.mark_pending_many([todo.id])
+        self.store.mark_pending(todo.id)
+        
+        # add, complete, then a single return to pending
+        with open(self.store.log_path, "rb") as f:
+            self.assertEqual(len(f.read().splitlines()), 3)
+
+    def test_batch(self):
+        """Test that changes inside batch() reach the log only when it exits."""
+        with self.store.batch():
+            first = self.store.add(Todo(description="First"))
+            with self.store.batch():
+                self.store.add(Todo(description="Second"))
+            self.store.mark_complete(first.id)
+            # The nested batch did not write on its own
+            self.assertFalse(os.path.exists(self.store.log_path))
+        
+        with open(self.store.log_path, "rb") as f:
+            self.assertEqual(len(f.read().splitlines()), 3)
+        reloaded = TodoStore(self.storage_path)
+        self.assertEqual(len(reloaded.get_all()), 2)
+        self.assertEqual(reloaded.get(first.id).status, Status.COMPLETED)
+
+    def test_log_compaction(self):
+        """Test that a full log is folded into the snapshot and emptied."""
+        self.store.compact_after = 3
+        for i in range(3):
+            self.store.add(Todo(description=f"Task {i}"))
+        
+        self.assertEqual(os.path.getsize(self.store.log_path), 0)
+        reloaded = TodoStore(self.storage_path)
+        self.assertEqual(
+            [t.description for t in reloaded.get_all()],
+            ["Task 0", "Task 1", "Task 2"]
+        )
+
+    def test_log_handle_kept_open(self):
+        """Test that appends reuse one log handle, including after compaction."""
+        self.store.compact_after = 2
+        self.store.add(Todo(description="First"))
+        log_fd = self.store._log_fd
+        self.store.add(Todo(description="Second"))  # Compacts
+        third = self.store.add(Todo(description="Third"))
+        
+        self.assertEqual(self.store._log_fd, log_fd)
+        with open(self.store.log_path, "rb") as f:
+            self.assertEqual(len(f.read().splitlines()), 1)
+        
+        self.store.close()
+        self.assertIsNone(self.store._log_fd)
+        self.store.close()  # Closing twice is harmless
+        self.assertEqual(TodoStore(self.storage_path).get(third.id).description, "Third")
+        
+        with TodoStore(self.storage_path) as scoped:
+            scoped.add(Todo(description="Fourth"))
+            self.assertIsNotNone(scoped._log_fd)
+        self.assertIsNone(scoped._log_fd)
+
+    def test_short_log_write_completed(self):
+        """Test that a record is fully written even when os.write writes only part of it."""
+        real_write = os.write
+        with mock.patch.object(models.os, "write", lambda fd, data: real_write(fd, bytes(data[:5]))):
+            todo = self.store.add(Todo(description="Written in pieces"))
+        
+        self.assertEqual(TodoStore(self.storage_path).get(todo.id).description, "Written in pieces")
+
+    def test_snapshot_written_atomically(self):
+        """Test that compaction replaces the snapshot without leaving a temp file."""
+        self.store.compact_after = 1
+        self.store.add(Todo(description="Snapshotted"))
+        
+        self.assertEqual(sorted(os.listdir(self.temp_dir.name)), ["todos.json", "todos.json.log"])
+        self.assertEqual(len(TodoStore(self.storage_path).get_all()), 1)
+
+    def test_snapshot_compact_unless_pretty(self):
+        """Test that the snapshot has no indentation unless pretty_snapshot is set."""
+        self.store.compact_after = 1
+        self.store.add(Todo(description="Compact"))
+        with open(self.storage_path, "rb") as f:
+            self.assertEqual(len(f.read().splitlines()), 1)
+        
+        self.store.pretty_snapshot = True
+        self.store.add(Todo(description="Pretty"))
+        with open(self.storage_path, "rb") as f:
+            self.assertIn(b'\n  "', f.read())
+        self.assertEqual(len(TodoStore(self.storage_path).get_all()), 2)
+
+    def test_failed_snapshot_keeps_log(self):
+        """Test that the log is kept when the snapshot cannot be replaced."""
+        self.store.compact_after = 2
+        os.mkdir(self.storage_path)  # os.replace cannot overwrite a directory
+        
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.store.add(Todo(description="First"))
+            self.store.add(Todo(description="Second"))
+        
+        self.assertIn("Error saving todos", out.getvalue())
+        self.assertFalse(os.path.exists(self.storage_path + ".tmp"))
+        with open(self.store.log_path, "rb") as f:
+            self.assertEqual(len(f.read().splitlines()), 2)
+
+    def test_torn_log_record_ignored(self):
+        """Test that a partially written last record is skipped on load."""
+        todo = self.store.add(Todo(description="Committed"))
+        with open(self.store.log_path, "ab") as f:
+            f.write(b'{"op": "put", "todo": {"descri')
+        
+        with TodoStore(self.storage_path) as reloaded:
+            self.assertEqual([t.id for t in reloaded.get_all()], [todo.id])
+            
+            # Later changes are not lost behind the fragment
+            later = reloaded.add(Todo(description="After the fragment"))
+        self.assertIsNotNone(TodoStore(self.storage_path).get(later.id))
+
+    def test_torn_non_ascii_log_record_ignored(self):
+        """Test that a record cut inside a multi-byte character is skipped by the stdlib parser."""
+        todo = self.store.add(Todo(description="Café"))
+        with open(self.store.log_path, "ab") as f:
+            f.write(b'{"op":"put","todo":{"description":"Caf\xc3')
+        
+        with mock.patch.object(models, "orjson", None):
+            with TodoStore(self.storage_path) as reloaded:
+                self.assertEqual([t.description for t in reloaded.get_all()], ["Café"])
+        self.assertEqual(TodoStore(self.storage_path).get(todo.id).description, "Café")
+
+    def test_malformed_log_record_skipped(self):
+        """Test that a record which cannot be applied is skipped with a warning, keeping later ones."""
+        before = self.store.add(Todo(description="Before"))
+        after = Todo(description="After", id="7")
+        for record in (
+            b'{"op":"put","todo":{"description":"Bad","priority":"urgent"}}',
+            b'{"op":"put","todo":{"priority":"high"}}',
+            b'{"op":"remove"}',
+            b'[1, 2]',
+            b'not json',
+        ):
+            with self.subTest(record=record):
+                with open(self.store.log_path, "wb") as f:
+                    f.write(models._dumps(TodoStore._put(before)) + b"\n")
+                    f.write(record + b"\n")
+                    f.write(models._dumps(TodoStore._put(after)) + b"\n")
+                
+                with contextlib.redirect_stdout(io.StringIO()) as out:
+                    reloaded = TodoStore(self.storage_path)
+                self.assertIn("Error loading todo log: skipped record 2", out.getvalue())
+                self.assertEqual([t.description for t in reloaded.get_all()], ["Before", "After"])
+                # Nothing is compacted away; the log is left for inspection
+                with open(self.store.log_path, "rb") as f:
+                    self.assertEqual(len(f.read().splitlines()), 3)
+
+    def test_stdlib_json_fallback(self):
+        """Test that files stay readable whether or not orjson is installed."""
+        todo = self.store.add(Todo(description="Café", priority=Priority.HIGH))
+        
+        # Read back (and rewrite) with the standard library only
+        with mock.patch.object(models, "orjson", None):
+            with TodoStore(self.storage_path) as fallback_store:
+                loaded = fallback_store.get(todo.id)
+                self.assertEqual(loaded.description, "Café")
+                self.assertIs(loaded.priority, Priority.HIGH)
+                fallback_store.mark_complete(todo.id)
+        
+        reloaded = TodoStore(self.storage_path).get(todo.id)
+        self.assertEqual(reloaded.status, Status.COMPLETED)
+
+
+    def test_lone_surrogate_saved(self):
+        """Test that text orjson cannot encode (undecodable argv bytes) is still saved."""
+        description = "caf\udce9"
+        self.store.compact_after = 2
+        first = self.store.add(Todo(description=description))  # Logged
+        second = self.store.add(Todo(description=description))  # Compacted into the snapshot
+        third = self.store.add(Todo(description=description))  # Logged after the snapshot
+        
+        reloaded = TodoStore(self.storage_path)
+        for todo in (first, second, third):
+            self.assertEqual(reloaded.get(todo.id).description, description)
+
+    def test_surrogate_escapes_loaded(self):
+        """Test that surrogate escapes written by the standard library load with orjson too."""
+        with open(self.storage_path, "wb") as f:
+            f.write(b'{"0": {"id": "0", "description": "caf\\udce9"}}')
+        with open(self.store.log_path, "wb") as f:
+            f.write(b'{"op":"put","todo":{"id":"1","description":"caf\\udce9"}}\n')
+        
+        reloaded = TodoStore(self.storage_path)
+        self.assertEqual([t.description for t in reloaded.get_all()], ["caf\udce9", "caf\udce9"])
+        self.assertGreater(os.path.getsize(self.store.log_path), 0)  # Not taken for a torn record
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,33 +1,78 @@
 """Command-line interface for the todo application."""
+import atexit
 import click
+import functools
 import shutil
 import sys
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 from datetime import datetime
 
-from rich.console import Console
-from rich.table import Table
-from rich.text import Text
-from rich.panel import Panel
+# Every command prints through the console; tables and panels are only
+# imported by the commands that draw them
+from rich.console import Console, Group
+from rich.markup import escape
+from rich.style import Style
 
 from .models import Todo, TodoStore, Priority, Status
 
+if TYPE_CHECKING:
+    from rich.table import Table
 
-def normalize_priority(priority: str) -> str:
-    """Convert shorthand priority (h, m, l) to full form (high, medium, low)."""
-    priority = priority.lower()
-    if priority == 'h':
-        return 'high'
-    elif priority == 'm':
-        return 'medium'
-    elif priority == 'l':
-        return 'low'
-    return priority
+
+# Priority option values (full and shorthand) and their presentation, shared by every command
+_PRIORITY_BY_STR = {
+    "high": Priority.HIGH,
+    "medium": Priority.MEDIUM,
+    "low": Priority.LOW,
+    "h": Priority.HIGH,
+    "m": Priority.MEDIUM,
+    "l": Priority.LOW
+}
+_PRIORITY_ORDER = {
+    Priority.HIGH: 0,
+    Priority.MEDIUM: 1,
+    Priority.LOW: 2
+}
+_PRIORITY_COLOR = {
+    Priority.HIGH: "red",
+    Priority.MEDIUM: "yellow",
+    Priority.LOW: "green"
+}
+_PRIORITY_FORMAT = {
+    Priority.HIGH: ("red", "🔴"),
+    Priority.MEDIUM: ("yellow", "🟡"),
+    Priority.LOW: ("green", "🟢")
+}
+
+# Message styles, parsed once instead of on every print
+_STYLE_ERROR = Style(color="red", bold=True)
+_STYLE_SUCCESS = Style(color="green", bold=True)
+_STYLE_PENDING = Style(color="yellow", bold=True)
+_STYLE_NOTICE = Style(color="yellow")
+_STYLE_INFO = Style(color="blue", bold=True)
+
+
+@functools.lru_cache(maxsize=1)
+def _term_size():
+    """Return the terminal size, queried once per process."""
+    return shutil.get_terminal_size()
+
+
+def _short_timestamp(timestamp_us: int) -> str:
+    """Format epoch microseconds as local "YYYY-MM-DD HH:MM"."""
+    return datetime.fromtimestamp(timestamp_us // 1_000_000).strftime("%Y-%m-%d %H:%M")
 
 
 # Initialize the todo store and console
 store = TodoStore()
-console = Console()
+# Output is styled explicitly, so skip Rich's automatic highlighting and :emoji: codes
+console = Console(highlight=False, emoji=False)
+
+
+@atexit.register
+def _close_store() -> None:
+    """Release the store's log file handle when the process exits."""
+    store.close()
 
 
 @click.group()
@@ -44,32 +89,70 @@ def cli():
 def add(description: str, file_path: Optional[str], priority: str):
     """Add a new todo with the given description."""
     try:
-        # Normalize priority
-        priority = normalize_priority(priority)
+        # Resolve full or shorthand priority
+        priority = _PRIORITY_BY_STR[priority.lower()]
         
         todo = Todo(
             description=description,
             file_path=file_path,
-            priority=Priority(priority)
+            priority=priority
         )
         store.add(todo)
         
         # Show confirmation with color based on priority
-        priority_color = {
-            Priority.HIGH: "red",
-            Priority.MEDIUM: "yellow",
-            Priority.LOW: "green"
-        }[todo.priority]
-        
-        console.print(f"✅ Added todo ", end="")
-        console.print(f"#{todo.id}", style="bold blue", end=": ")
-        console.print(description, end=" ")
-        console.print(f"({priority})", style=f"bold {priority_color}")
-    except Exception as e:
-        console.print(f"❌ Error adding todo: {str(e)}", style="bold red")
+        priority_color = _PRIORITY_COLOR[todo.priority]
+        
+        console.print(
+            f"✅ Added todo [bold blue]#{todo.id}[/]: {escape(description)} "
+            f"[bold {priority_color}]({priority.value})[/]"
+        )
+    except (ValueError, KeyError, OSError) as e:
+        console.print(f"❌ Error adding todo: {escape(str(e))}", style=_STYLE_ERROR)
         sys.exit(1)
 
 
+def render_todos(todos: List[Todo]) -> "Table":
+    """Build the table shown by the list command, one row per todo in the given order."""
+    from rich.table import Table
+    
+    # Create a table for displaying todos
+    table = Table(show_header=True, header_style="bold")
+    table.add_column("Status", style="bold", width=3)
+    table.add_column("ID", style="dim", width=8)
+    
+    # Get terminal width to determine description column width
+    term_width = _term_size().columns
+    desc_width = max(20, term_width - 50)  # Adjust based on other columns
+    
+    # Rich cuts long descriptions to one line ending in an ellipsis
+    table.add_column("Description", width=desc_width, no_wrap=True, overflow="ellipsis")
+    table.add_column("Priority", width=10)
+    table.add_column("File", width=15)
+    
+    # Add rows to the table
+    for todo in todos:
+        # Format status
+        status_str = "✓" if todo.status == Status.COMPLETED else " "
+        
+        # Format priority with color and emoji
+        color, emoji = _PRIORITY_FORMAT[todo.priority]
+        priority_str = f"[{color}]{emoji} {todo.priority.value}[/]"
+        
+        # Format file path
+        file_str = escape(todo.file_path) if todo.file_path else ""
+        
+        # Add the row; user-entered text is escaped so it is not read as markup
+        table.add_row(
+            status_str,
+            todo.id,
+            escape(todo.description),
+            priority_str,
+            file_str
+        )
+    
+    return table
+
+
 @cli.command("l", help="List todos")
 @click.option("-c", "--completed", is_flag=True, help="Show only completed todos")
 @click.option("-p", "--pending", is_flag=True, help="Show only pending todos")
@@ -89,63 +172,25 @@ def list_todos(completed: bool, pending: bool, file_path: Optional[str]):
             console.print("[yellow]No todos found.[/yellow]")
             return
         
-        # Sort todos by priority (high to low) and then by ID
-        priority_order = {
-            Priority.HIGH: 0,
-            Priority.MEDIUM: 1,
-            Priority.LOW: 2
-        }
-        
-        todos.sort(key=lambda t: (priority_order[t.priority], int(t.id)))
-        
-        # Create a table for displaying todos
-        table = Table(show_header=True, header_style="bold")
-        table.add_column("Status", style="bold", width=3)
-        table.add_column("ID", style="dim", width=8)
-        
-        # Get terminal width to determine description column width
-        term_width = shutil.get_terminal_size().columns
-        desc_width = max(20, term_width - 50)  # Adjust based on other columns
-        
-        table.add_column("Description", width=desc_width)
-        table.add_column("Priority", width=10)
-        table.add_column("File", width=15)
-        
-        # Add rows to the table
-        for todo in todos:
-            # Format status
-            status_str = "✓" if todo.status == Status.COMPLETED else " "
-            
-            # Format priority with color and emoji
-            priority_format = {
-                Priority.HIGH: ("red", "🔴"),
-                Priority.MEDIUM: ("yellow", "🟡"),
-                Priority.LOW: ("green", "🟢")
-            }[todo.priority]
-            priority_str = Text(f"{priority_format[1]} {todo.priority.value}", style=priority_format[0])
-            
-            # Truncate description if needed
-            description = todo.description
-            if len(description) > desc_width:
-                description = description[:desc_width-3] + "..."
-            
-            # Format file path
-            file_str = todo.file_path if todo.file_path else ""
-            
-            # Add the row
-            table.add_row(
-                status_str,
-                todo.id,
-                description,
-                priority_str,
-                file_str
-            )
-        
-        console.print(f"Found {len(todos)} todo(s):")
-        console.print(table)
-        console.print("Use [bold]todo s <id>[/bold] to show full details of a specific todo.")
-    except Exception as e:
-        console.print(f"❌ Error listing todos: {str(e)}", style="bold red")
+        # Sort todos by priority (high to low) and then by ID; the index keeps
+        # tuple comparison from ever reaching the Todo objects
+        decorated = [
+            (_PRIORITY_ORDER[t.priority], int(t.id), i, t)
+            for i, t in enumerate(todos)
+        ]
+        decorated.sort()
+        todos = [d[3] for d in decorated]
+        
+        table = render_todos(todos)
+        
+        # Print everything in one go so the console renders and flushes once
+        console.print(Group(
+            f"Found {len(todos)} todo(s):",
+            table,
+            "Use [bold]todo s <id>[/bold] to show full details of a specific todo.",
+        ))
+    except (ValueError, KeyError, OSError) as e:
+        console.print(f"❌ Error listing todos: {escape(str(e))}", style=_STYLE_ERROR)
         sys.exit(1)
 
 
@@ -160,51 +205,40 @@ def complete(todo_ids: List[str], all: bool):
             pending_todos = store.filter(status=Status.PENDING)
             
             if not pending_todos:
-                console.print("No pending todos to complete.", style="yellow")
+                console.print("No pending todos to complete.", style=_STYLE_NOTICE)
                 return
             
             # Mark all pending todos as completed
-            count = 0
-            for todo in pending_todos:
-                store.mark_complete(todo.id)
-                count += 1
+            count = len(store.mark_complete_many(todo.id for todo in pending_todos))
             
-            console.print(f"✅ Marked {count} todos as completed.", style="bold green")
+            console.print(f"✅ Marked {count} todos as completed.", style=_STYLE_SUCCESS)
             return
         
         # Case 2: Mark specific todos as completed
         if not todo_ids:
-            console.print("Please specify either todo ID(s) or use the --all flag.", style="yellow")
+            console.print("Please specify either todo ID(s) or use the --all flag.", style=_STYLE_NOTICE)
             return
             
-        todos_completed = []
-        not_found_ids = []
-        
-        # Process each todo ID
-        for todo_id in todo_ids:
-            todo = store.mark_complete(todo_id)
-            if todo:
-                todos_completed.append(todo)
-            else:
-                not_found_ids.append(todo_id)
+        # Process all todo IDs with a single save
+        not_found_ids = [todo_id for todo_id in todo_ids if store.get(todo_id) is None]
+        todos_completed = store.mark_complete_many(todo_ids)
         
         # Report any IDs that weren't found
         if not_found_ids:
-            console.print(f"❌ Todo(s) not found: {', '.join(not_found_ids)}", style="bold red")
+            console.print(f"❌ Todo(s) not found: {escape(', '.join(not_found_ids))}", style=_STYLE_ERROR)
             if not todos_completed:
                 sys.exit(1)
         
         # Report successful completions
         if len(todos_completed) == 1:
-            console.print(f"✅ Marked as Completed: ", end="")
-            console.print(f"{todos_completed[0].description}", style="bold green")
+            console.print(f"✅ Marked as Completed: [bold green]{escape(todos_completed[0].description)}[/]")
         else:
-            console.print(f"✅ Marked {len(todos_completed)} todos as completed:", style="bold green")
-            for todo in todos_completed:
-                console.print(f"  • {todo.description}")
+            lines = [f"[bold green]✅ Marked {len(todos_completed)} todos as completed:[/]"]
+            lines.extend(f"  • {escape(todo.description)}" for todo in todos_completed)
+            console.print("\n".join(lines))
         
-    except Exception as e:
-        console.print(f"❌ Error completing todos: {str(e)}", style="bold red")
+    except (ValueError, KeyError, OSError) as e:
+        console.print(f"❌ Error completing todos: {escape(str(e))}", style=_STYLE_ERROR)
         sys.exit(1)
 
 
@@ -219,51 +253,40 @@ def pending(todo_ids: List[str], all: bool):
             completed_todos = store.filter(status=Status.COMPLETED)
             
             if not completed_todos:
-                console.print("No completed todos to mark as pending.", style="yellow")
+                console.print("No completed todos to mark as pending.", style=_STYLE_NOTICE)
                 return
             
             # Mark all completed todos as pending
-            count = 0
-            for todo in completed_todos:
-                store.mark_pending(todo.id)
-                count += 1
+            count = len(store.mark_pending_many(todo.id for todo in completed_todos))
             
-            console.print(f"🔄 Marked {count} todos as pending.", style="bold yellow")
+            console.print(f"🔄 Marked {count} todos as pending.", style=_STYLE_PENDING)
             return
         
         # Case 2: Mark specific todos as pending
         if not todo_ids:
-            console.print("Please specify either todo ID(s) or use the --all flag.", style="yellow")
+            console.print("Please specify either todo ID(s) or use the --all flag.", style=_STYLE_NOTICE)
             return
             
-        todos_pending = []
-        not_found_ids = []
-        
-        # Process each todo ID
-        for todo_id in todo_ids:
-            todo = store.mark_pending(todo_id)
-            if todo:
-                todos_pending.append(todo)
-            else:
-                not_found_ids.append(todo_id)
+        # Process all todo IDs with a single save
+        not_found_ids = [todo_id for todo_id in todo_ids if store.get(todo_id) is None]
+        todos_pending = store.mark_pending_many(todo_ids)
         
         # Report any IDs that weren't found
         if not_found_ids:
-            console.print(f"❌ Todo(s) not found: {', '.join(not_found_ids)}", style="bold red")
+            console.print(f"❌ Todo(s) not found: {escape(', '.join(not_found_ids))}", style=_STYLE_ERROR)
             if not todos_pending:
                 sys.exit(1)
         
         # Report successful changes to pending
         if len(todos_pending) == 1:
-            console.print(f"🔄 Marked as Pending: ", end="")
-            console.print(f"{todos_pending[0].description}", style="bold yellow")
+            console.print(f"🔄 Marked as Pending: [bold yellow]{escape(todos_pending[0].description)}[/]")
         else:
-            console.print(f"🔄 Marked {len(todos_pending)} todos as pending:", style="bold yellow")
-            for todo in todos_pending:
-                console.print(f"  • {todo.description}")
+            lines = [f"[bold yellow]🔄 Marked {len(todos_pending)} todos as pending:[/]"]
+            lines.extend(f"  • {escape(todo.description)}" for todo in todos_pending)
+            console.print("\n".join(lines))
         
-    except Exception as e:
-        console.print(f"❌ Error marking todos as pending: {str(e)}", style="bold red")
+    except (ValueError, KeyError, OSError) as e:
+        console.print(f"❌ Error marking todos as pending: {escape(str(e))}", style=_STYLE_ERROR)
         sys.exit(1)
 
 
@@ -273,51 +296,49 @@ def pending(todo_ids: List[str], all: bool):
 @click.argument("todo_id")
 def show(todo_id: str):
     """Show details of a specific todo."""
+    from rich.panel import Panel
+    
     try:
         todo = store.get(todo_id)
         if not todo:
-            console.print(f"❌ Todo #{todo_id} not found.", style="bold red")
+            console.print(f"❌ Todo #{escape(todo_id)} not found.", style=_STYLE_ERROR)
             sys.exit(1)
         
         # Create a panel with todo details
         status_color = "green" if todo.status == Status.COMPLETED else "yellow"
-        priority_color = {
-            Priority.HIGH: "red",
-            Priority.MEDIUM: "yellow",
-            Priority.LOW: "green"
-        }[todo.priority]
+        priority_color = _PRIORITY_COLOR[todo.priority]
         
         # Format dates for better readability
-        created_date = datetime.fromisoformat(todo.created_at).strftime("%Y-%m-%d %H:%M")
+        created_date = _short_timestamp(todo.created_at)
         completed_date = None
         if todo.completed_at:
-            completed_date = datetime.fromisoformat(todo.completed_at).strftime("%Y-%m-%d %H:%M")
-        
-        # Build the content
-        content = [
-            Text(f"ID: {todo.id}", style="dim"),
-            Text(f"Description: {todo.description}", style="bold"),
-            Text(f"Status: {todo.status.value}", style=status_color),
-            Text(f"Priority: {todo.priority.value}", style=priority_color),
-        ]
+            completed_date = _short_timestamp(todo.completed_at)
+        
+        # Build the content as markup; user-entered text is escaped
+        body = (
+            f"[dim]ID: {todo.id}[/]\n"
+            f"[bold]Description: {escape(todo.description)}[/]\n"
+            f"[{status_color}]Status: {todo.status.value}[/]\n"
+            f"[{priority_color}]Priority: {todo.priority.value}[/]"
+        )
         
         if todo.file_path:
-            content.append(Text(f"File: {todo.file_path}", style="blue underline"))
+            body += f"\n[blue underline]File: {escape(todo.file_path)}[/]"
         
-        content.append(Text(f"Created: {created_date}"))
+        body += f"\nCreated: {created_date}"
         
         if completed_date:
-            content.append(Text(f"Completed: {completed_date}", style="green"))
+            body += f"\n[green]Completed: {completed_date}[/]"
         
         # Display the panel
         panel = Panel(
-            "\n".join(str(line) for line in content),
+            body,
             title=f"Todo Details",
             border_style="blue"
         )
         console.print(panel)
-    except Exception as e:
-        console.print(f"❌ Error showing todo: {str(e)}", style="bold red")
+    except (ValueError, KeyError, OSError) as e:
+        console.print(f"❌ Error showing todo: {escape(str(e))}", style=_STYLE_ERROR)
         sys.exit(1)
 
 
@@ -329,7 +350,7 @@ def show(todo_id: str):
 @click.option("-f", "--force", is_flag=True, help="Skip confirmation")
 def erase(todo_ids: List[str], all: bool, completed: bool, pending: bool, force: bool):
     """
-    Erase todos. With todo_ids, it marks as completed and removes those specific todos.
+    Erase todos. With todo_ids, it removes those specific todos.
     With --all, --completed, or --pending flags, it erases multiple todos.
     """
     try:
@@ -348,36 +369,25 @@ def erase(todo_ids: List[str], all: bool, completed: bool, pending: bool, force:
             
             # Report any IDs that weren't found
             if not_found_ids:
-                console.print(f"❌ Todo(s) not found: {', '.join(not_found_ids)}", style="bold red")
+                console.print(f"❌ Todo(s) not found: {escape(', '.join(not_found_ids))}", style=_STYLE_ERROR)
                 if not todos_to_erase:
                     sys.exit(1)
             
             # Confirm before erasing
             if not force and todos_to_erase:
-                descriptions = [f"#{todo.id}: {todo.description}" for todo in todos_to_erase]
-                console.print(Panel("\n".join(descriptions), title=f"Erase {len(todos_to_erase)} todo(s)?"))
-                confirm = click.confirm("Proceed?")
-                if not confirm:
-                    console.print("Operation cancelled.", style="yellow")
+                lines = [f"#{todo.id}: {todo.description}" for todo in todos_to_erase]
+                lines.append(f"Erase {len(todos_to_erase)} todo(s)?")
+                if not click.confirm("\n".join(lines), default=False):
+                    console.print("Operation cancelled.", style=_STYLE_NOTICE)
                     return
             
-            # Mark as completed and remove
-            count = 0
-            for todo in todos_to_erase:
-                # First mark as completed
-                if todo.status != Status.COMPLETED:
-                    todo.mark_complete()
-                    store.update(todo)
-                
-                # Then remove
-                store.remove(todo.id)
-                count += 1
+            # Remove them all with a single save
+            count = len(store.remove_many(todo.id for todo in todos_to_erase))
             
             if count == 1:
-                console.print(f"✨ Erased: ", end="")
-                console.print(f"{todos_to_erase[0].description}", style="bold green")
+                console.print(f"✨ Erased: [bold green]{escape(todos_to_erase[0].description)}[/]")
             else:
-                console.print(f"✨ Erased {count} todos.", style="bold green")
+                console.print(f"✨ Erased {count} todos.", style=_STYLE_SUCCESS)
             return
         
         # Case 2: Erase multiple todos based on flags
@@ -385,44 +395,33 @@ def erase(todo_ids: List[str], all: bool, completed: bool, pending: bool, force:
         
         if all:
             todos_to_erase = store.get_all()
-            action_description = "all todos"
+            action_noun = "todos"
         elif completed:
             todos_to_erase = store.filter(status=Status.COMPLETED)
-            action_description = "all completed todos"
+            action_noun = "completed todos"
         elif pending:
             todos_to_erase = store.filter(status=Status.PENDING)
-            action_description = "all pending todos"
+            action_noun = "pending todos"
         else:
-            console.print("Please specify either todo ID(s) or use --all, --completed, or --pending flags.", style="yellow")
+            console.print("Please specify either todo ID(s) or use --all, --completed, or --pending flags.", style=_STYLE_NOTICE)
             return
         
         if not todos_to_erase:
-            console.print(f"No {action_description.split(' ', 1)[1]} to erase.", style="yellow")
+            console.print(f"No {action_noun} to erase.", style=_STYLE_NOTICE)
             return
         
         if not force:
-            console.print(Panel(f"Are you sure you want to erase {len(todos_to_erase)} {action_description.split(' ', 1)[1]}?"))
-            confirm = click.confirm("Proceed?")
-            if not confirm:
-                console.print("Operation cancelled.", style="yellow")
+            if not click.confirm(f"Erase {len(todos_to_erase)} {action_noun}?", default=False):
+                console.print("Operation cancelled.", style=_STYLE_NOTICE)
                 return
         
-        # Mark pending todos as completed before removing
-        for todo in todos_to_erase:
-            if todo.status != Status.COMPLETED:
-                todo.mark_complete()
-                store.update(todo)
-        
         # Remove all the todos
-        count = 0
-        for todo in todos_to_erase:
-            store.remove(todo.id)
-            count += 1
+        count = len(store.remove_many(todo.id for todo in todos_to_erase))
         
-        console.print(f"✨ Erased {count} {action_description.split(' ', 1)[1]}.", style="bold green")
+        console.print(f"✨ Erased {count} {action_noun}.", style=_STYLE_SUCCESS)
         
-    except Exception as e:
-        console.print(f"❌ Error erasing todos: {str(e)}", style="bold red")
+    except (ValueError, KeyError, OSError) as e:
+        console.print(f"❌ Error erasing todos: {escape(str(e))}", style=_STYLE_ERROR)
         sys.exit(1)
 
 @cli.command("m", help="Modify todos priority")
@@ -435,30 +434,28 @@ def modify(todo_ids: List[str], priority: str, all: bool):
     or use --all flag to modify all todos.
     """
     try:
-        # Normalize priority
-        priority = normalize_priority(priority)
+        # Resolve full or shorthand priority
+        priority = _PRIORITY_BY_STR[priority.lower()]
         
         # Case 1: Modify all todos
         if all:
             todos_to_modify = store.get_all()
             
             if not todos_to_modify:
-                console.print("No todos to modify.", style="yellow")
+                console.print("No todos to modify.", style=_STYLE_NOTICE)
                 return
             
             # Update priority for all todos
-            count = 0
             for todo in todos_to_modify:
-                todo.priority = Priority(priority)
-                store.update(todo)
-                count += 1
+                todo.priority = priority
+            count = len(store.update_many(todos_to_modify))
             
-            console.print(f"✨ Updated priority to {priority} for {count} todos.", style="bold blue")
+            console.print(f"✨ Updated priority to {priority.value} for {count} todos.", style=_STYLE_INFO)
             return
         
         # Case 2: Modify specific todos by ID(s)
         if not todo_ids:
-            console.print("Please specify either todo ID(s) or use the --all flag.", style="yellow")
+            console.print("Please specify either todo ID(s) or use the --all flag.", style=_STYLE_NOTICE)
             return
             
         todos_to_modify = []
@@ -474,26 +471,25 @@ def modify(todo_ids: List[str], priority: str, all: bool):
         
         # Report any IDs that weren't found
         if not_found_ids:
-            console.print(f"❌ Todo(s) not found: {', '.join(not_found_ids)}", style="bold red")
+            console.print(f"❌ Todo(s) not found: {escape(', '.join(not_found_ids))}", style=_STYLE_ERROR)
             if not todos_to_modify:
                 sys.exit(1)
         
         # Update priority
-        count = 0
         for todo in todos_to_modify:
-            # Update priority
-            todo.priority = Priority(priority)
-            store.update(todo)
-            count += 1
+            todo.priority = priority
+        count = len(store.update_many(todos_to_modify))
         
         if count == 1:
-            console.print(f"✨ Updated priority to {priority}: ", end="")
-            console.print(f"{todos_to_modify[0].description}", style="bold blue")
+            console.print(
+                f"✨ Updated priority to {priority.value}: "
+                f"[bold blue]{escape(todos_to_modify[0].description)}[/]"
+            )
         else:
-            console.print(f"✨ Updated priority to {priority} for {count} todos.", style="bold blue")
+            console.print(f"✨ Updated priority to {priority.value} for {count} todos.", style=_STYLE_INFO)
         
-    except Exception as e:
-        console.print(f"❌ Error modifying todos: {str(e)}", style="bold red")
+    except (ValueError, KeyError, OSError) as e:
+        console.print(f"❌ Error modifying todos: {escape(str(e))}", style=_STYLE_ERROR)
         sys.exit(1)
 
 if __name__ == "__main__":
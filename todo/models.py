@@ -1,10 +1,65 @@
-from dataclasses import dataclass, field, asdict
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, Iterable, Iterator, List, Any
 import json
+import mmap
 import os
-import heapq  # For min heap operations
+import sys
+import time
+
+try:
+    import orjson  # Optional, much faster JSON encoding and decoding
+except ImportError:
+    orjson = None
+
+
+# Bit i is set while ID i (0-99) is free
+_ALL_IDS_FREE = (1 << 100) - 1
+
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON, with orjson when it is available.
+
+    orjson rejects strings the standard library accepts, such as the lone
+    surrogates that undecodable command-line bytes turn into; those fall back
+    to the standard library, which writes them as escapes.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except orjson.JSONEncodeError:
+            pass
+    if indent:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Decode UTF-8 JSON, with orjson when it is available.
+
+    Input orjson refuses (e.g. the surrogate escapes _dumps may write) is
+    retried with the standard library, which raises if it is really invalid.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _load_file(path: str) -> Any:
+    """Decode a non-empty JSON file; orjson parses it straight from a memory map."""
+    with open(path, "rb") as f:
+        if orjson is not None:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+            except orjson.JSONDecodeError:
+                pass  # Retried with the standard library below, as in _loads
+        return json.loads(f.read())
 
 
 class Priority(str, Enum):
@@ -18,20 +73,65 @@ class Status(str, Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+# Stored values to members, so loading skips the Enum constructor
+_PRIORITY_LOOKUP: Dict[str, Priority] = {priority.value: priority for priority in Priority}
+_STATUS_LOOKUP: Dict[str, Status] = {status.value: status for status in Status}
+
+
+# Set while a TodoStore.batch() is open so every change in it shares one timestamp
+_pinned_now: Optional[int] = None
+
+
+def _now_us() -> int:
+    """Return the current time as integer microseconds since the Unix epoch."""
+    if _pinned_now is not None:
+        return _pinned_now
+    return time.time_ns() // 1000
+
+
+def _timestamp_us(value: Any) -> Optional[int]:
+    """Convert a stored timestamp to epoch microseconds.
+
+    Files written before timestamps became integers hold naive local-time
+    ISO-8601 strings; those are converted on load.
+    """
+    if isinstance(value, str):
+        moment = datetime.fromisoformat(value)
+        return int(moment.timestamp()) * 1_000_000 + moment.microsecond
+    return value
+
+
+@contextmanager
+def _pin_now() -> Iterator[None]:
+    """Make _now_us() return one fixed timestamp until the block exits."""
+    global _pinned_now
+    previous = _pinned_now
+    _pinned_now = _now_us()
+    try:
+        yield
+    finally:
+        _pinned_now = previous
+
+
+# Todo gets __slots__ where dataclasses can generate them (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Todo:
     description: str
     priority: Priority = Priority.MEDIUM
     file_path: Optional[str] = None
     id: str = field(default="0")  # Default ID, will be assigned by TodoStore
     status: Status = Status.PENDING
-    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
-    completed_at: Optional[str] = None
+    # Microseconds since the Unix epoch
+    created_at: int = field(default_factory=_now_us)
+    completed_at: Optional[int] = None
 
     def mark_complete(self) -> None:
         """Mark the todo as completed with current timestamp."""
         self.status = Status.COMPLETED
-        self.completed_at = datetime.now().isoformat()
+        self.completed_at = _now_us()
         
     def mark_pending(self) -> None:
         """Mark the todo as pending, removing completion timestamp."""
@@ -39,21 +139,49 @@ class Todo:
         self.completed_at = None
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert Todo to dictionary for serialization."""
-        return asdict(self)
+        """Convert Todo to a dictionary of plain JSON values for serialization."""
+        return {
+            "description": self.description,
+            "priority": self.priority.value,
+            "file_path": self.file_path,
+            "id": self.id,
+            "status": self.status.value,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
+        }
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Todo':
-        """Create a Todo instance from a dictionary."""
-        # Convert string values to enum types
-        if "priority" in data:
-            data["priority"] = Priority(data["priority"])
-        if "status" in data:
-            data["status"] = Status(data["status"])
-        return cls(**data)
+        """Create a Todo instance from a dictionary; missing keys take their defaults."""
+        created_at = _timestamp_us(data.get("created_at"))
+        priority = data.get("priority", "medium")
+        status = data.get("status", "pending")
+        return cls(
+            description=data["description"],
+            # Unknown values fall through to the constructor, which raises ValueError
+            priority=_PRIORITY_LOOKUP.get(priority) or Priority(priority),
+            file_path=data.get("file_path"),
+            id=data.get("id", "0"),
+            status=_STATUS_LOOKUP.get(status) or Status(status),
+            created_at=created_at if created_at is not None else _now_us(),
+            completed_at=_timestamp_us(data.get("completed_at")),
+        )
 
 
 class TodoStore:
+    """Todos kept in memory and persisted as a JSON snapshot plus an append-only log.
+
+    Every change is appended to ``<storage_path>.log`` as one JSON record per
+    line instead of rewriting the whole file. Loading replays the log over
+    the snapshot, and once the log holds ``compact_after`` records it is
+    folded back into a fresh snapshot.
+    """
+
+    # Log records to accumulate before rewriting the snapshot
+    compact_after = 256
+    # Indent the snapshot for reading by hand; off by default to keep it small
+    pretty_snapshot = False
+
     def __init__(self, storage_path: str = None):
         """Initialize the TodoStore with a path to the storage file."""
         if storage_path is None:
@@ -68,56 +196,220 @@ class TodoStore:
             storage_path = os.path.join(storage_dir, "todos.json")
         
         self.storage_path = storage_path
+        self.log_path = storage_path + ".log"
+        self._log_fd: Optional[int] = None  # Opened on the first append, kept until close()
+        self._log_entries = 0
+        self._batch_depth = 0
+        self._batched: List[Dict[str, Any]] = []
         self.todos: Dict[str, Todo] = {}
-        self.available_ids = list(range(100))  # IDs from 0-99
-        heapq.heapify(self.available_ids)  # Convert to min heap
+        self._free_ids = _ALL_IDS_FREE  # IDs from 0-99, as a bitset
+        # Todos by status, kept in step with self.todos so filter() skips the rest
+        self._by_status: Dict[Status, Dict[str, Todo]] = {status: {} for status in Status}
         self._load()
 
     def _load(self) -> None:
-        """Load todos from the storage file."""
+        """Load todos from the snapshot file, then replay the log on top of it."""
+        self.todos = {}
         if os.path.exists(self.storage_path) and os.path.getsize(self.storage_path) > 0:
             try:
-                with open(self.storage_path, "r") as f:
-                    data = json.load(f)
-                    self.todos = {
-                        todo_id: Todo.from_dict(todo_data)
-                        for todo_id, todo_data in data.items()
-                    }
-                
-                # Rebuild the available IDs heap
-                used_ids = set(int(todo_id) for todo_id in self.todos.keys())
-                self.available_ids = [i for i in range(100) if i not in used_ids]
-                heapq.heapify(self.available_ids)
-                
-            except (json.JSONDecodeError, IOError) as e:
+                data = _load_file(self.storage_path)
+                self.todos = {
+                    todo_id: Todo.from_dict(todo_data)
+                    for todo_id, todo_data in data.items()
+                }
+            except (ValueError, OSError) as e:  # Includes JSONDecodeError
                 print(f"Error loading todos: {e}")
                 # Initialize with empty dict if file is corrupted
                 self.todos = {}
-        else:
-            self.todos = {}
+        
+        self._replay_log()
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        """Recompute the available IDs and the status index from self.todos."""
+        # Rebuild the free ID bitset
+        self._free_ids = _ALL_IDS_FREE
+        for todo_id in self.todos:
+            self._free_ids &= ~(1 << int(todo_id))
+        
+        self._by_status = {status: {} for status in Status}
+        for todo_id, todo in self.todos.items():
+            self._by_status[todo.status][todo_id] = todo
+
+    def _index(self, todo: Todo) -> None:
+        """File a todo under its current status in the status index."""
+        for status, todos in self._by_status.items():
+            if status is todo.status:
+                todos[todo.id] = todo
+            else:
+                todos.pop(todo.id, None)
+
+    def _unindex(self, todo_id: str) -> None:
+        """Drop a todo from the status index."""
+        for todos in self._by_status.values():
+            todos.pop(todo_id, None)
 
-    def _save(self) -> None:
-        """Save todos to the storage file."""
+    def _replay_log(self) -> None:
+        """Apply the records in the log file to the loaded todos."""
+        self._log_entries = 0
         try:
-            with open(self.storage_path, "w") as f:
-                serialized = {
-                    todo_id: todo.to_dict()
-                    for todo_id, todo in self.todos.items()
-                }
-                json.dump(serialized, f, indent=2)
+            with open(self.log_path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
         except IOError as e:
+            print(f"Error loading todo log: {e}")
+            return
+        
+        lines = data.splitlines()
+        # Every record ends in a newline, so a file that does not was cut short mid-write
+        torn = not data.endswith(b"\n") and bool(data)
+        for number, line in enumerate(lines, 1):
+            try:
+                record = _loads(line)
+                if record["op"] == "put":
+                    todo = Todo.from_dict(record["todo"])
+                    self.todos[todo.id] = todo
+                elif record["op"] == "remove":
+                    self.todos.pop(record["id"], None)
+            except (ValueError, KeyError, TypeError) as e:  # Includes JSONDecodeError, UnicodeDecodeError
+                if torn and number == len(lines):
+                    # The fragment of an interrupted write; it was never committed
+                    break
+                print(f"Error loading todo log: skipped record {number}: {e!r}")
+                continue
+            self._log_entries += 1
+        
+        if torn:
+            # Compact so later records are not appended to the fragment
+            self._compact()
+
+    def _save(self) -> bool:
+        """Write all todos to the snapshot file. Returns whether the write succeeded.
+
+        The snapshot is written to a temporary file that then replaces the old
+        one, so a crash mid-write never leaves a truncated snapshot behind.
+        """
+        serialized = {
+            todo_id: todo.to_dict()
+            for todo_id, todo in self.todos.items()
+        }
+        payload = _dumps(serialized, indent=self.pretty_snapshot)
+        tmp_path = self.storage_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.storage_path)
+        except OSError as e:
+            print(f"Error saving todos: {e}")
+            with suppress(OSError):
+                os.remove(tmp_path)
+            return False
+        return True
+
+    def _record(self, records: List[Dict[str, Any]]) -> None:
+        """Persist change records now, or at the end of the enclosing batch()."""
+        if self._batch_depth:
+            self._batched.extend(records)
+        else:
+            self._append(records)
+
+    @contextmanager
+    def batch(self) -> Iterator['TodoStore']:
+        """Group changes so they are written to the log together when the block exits.
+
+        Batches nest; only the outermost one writes. Todos created or
+        completed inside a batch all get the same timestamp.
+        """
+        self._batch_depth += 1
+        try:
+            with _pin_now():
+                yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batched:
+                records, self._batched = self._batched, []
+                self._append(records)
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        """Append change records to the log, compacting it once it grows too long."""
+        payload = b"".join(_dumps(record) + b"\n" for record in records)
+        try:
+            if self._log_fd is None:
+                self._log_fd = os.open(
+                    self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0),
+                    0o644,
+                )
+            # os.write may write less than asked; finish the rest so no record is torn
+            pending = memoryview(payload)
+            while pending:
+                pending = pending[os.write(self._log_fd, pending):]
+        except OSError as e:
             print(f"Error saving todos: {e}")
+            return
+        
+        self._log_entries += len(records)
+        if self._log_entries >= self.compact_after:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Write the current todos as a new snapshot and empty the log."""
+        if not self._save():
+            # Keep the log; it still holds changes the snapshot is missing
+            return
+        try:
+            # Replaying records over a snapshot that already has them is harmless,
+            # so a crash between the two steps loses nothing
+            if self._log_fd is not None:
+                # O_APPEND puts the next record at the new end of file
+                os.ftruncate(self._log_fd, 0)
+            else:
+                with open(self.log_path, "wb"):
+                    pass
+        except OSError as e:
+            print(f"Error saving todos: {e}")
+            return
+        self._log_entries = 0
+
+    def close(self) -> None:
+        """Close the log file handle; the next change reopens it."""
+        if self._log_fd is not None:
+            os.close(self._log_fd)
+            self._log_fd = None
+
+    def __enter__(self) -> 'TodoStore':
+        """Use the store as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the log file handle."""
+        self.close()
+
+    @staticmethod
+    def _put(todo: Todo) -> Dict[str, Any]:
+        """Build the log record that stores a todo's current state."""
+        return {"op": "put", "todo": todo.to_dict()}
+
+    @staticmethod
+    def _removal(todo_id: str) -> Dict[str, Any]:
+        """Build the log record that removes a todo."""
+        return {"op": "remove", "id": todo_id}
 
     def add(self, todo: Todo) -> Todo:
         """Add a new todo to the store."""
-        if not self.available_ids:
+        if not self._free_ids:
             raise ValueError("Maximum number of todos (100) reached. Please remove some todos first.")
         
-        # Get the lowest available ID
-        next_id = str(heapq.heappop(self.available_ids))
+        # Get the lowest available ID: the lowest set bit
+        lowest = self._free_ids & -self._free_ids
+        self._free_ids ^= lowest
+        next_id = str(lowest.bit_length() - 1)
         todo.id = next_id
         self.todos[next_id] = todo
-        self._save()
+        self._index(todo)
+        self._record([self._put(todo)])
         return todo
 
     def get(self, todo_id: str) -> Optional[Todo]:
@@ -133,37 +425,101 @@ class TodoStore:
         if todo.id not in self.todos:
             raise ValueError(f"Todo with ID {todo.id} not found")
         self.todos[todo.id] = todo
-        self._save()
+        self._index(todo)
+        self._record([self._put(todo)])
         return todo
 
+    def update_many(self, todos: Iterable[Todo]) -> List[Todo]:
+        """Update several existing todos, logging them together."""
+        todos = list(todos)
+        for todo in todos:
+            if todo.id not in self.todos:
+                raise ValueError(f"Todo with ID {todo.id} not found")
+        for todo in todos:
+            self.todos[todo.id] = todo
+            self._index(todo)
+        if todos:
+            self._record([self._put(todo) for todo in todos])
+        return todos
+
     def remove(self, todo_id: str) -> bool:
         """Remove a todo by ID."""
         if todo_id in self.todos:
             del self.todos[todo_id]
+            self._unindex(todo_id)
             # Return the ID to the available pool
-            heapq.heappush(self.available_ids, int(todo_id))
-            self._save()
+            self._free_ids |= 1 << int(todo_id)
+            self._record([self._removal(todo_id)])
             return True
         return False
 
+    def remove_many(self, todo_ids: Iterable[str]) -> List[str]:
+        """Remove several todos by ID, logging them together. Returns the IDs that were removed."""
+        removed = []
+        for todo_id in todo_ids:
+            if todo_id in self.todos:
+                del self.todos[todo_id]
+                self._unindex(todo_id)
+                self._free_ids |= 1 << int(todo_id)
+                removed.append(todo_id)
+        if removed:
+            self._record([self._removal(todo_id) for todo_id in removed])
+        return removed
+
     def mark_complete(self, todo_id: str) -> Optional[Todo]:
-        """Mark a todo as completed."""
+        """Mark a todo as completed. Already completed todos are left untouched."""
         todo = self.get(todo_id)
         if todo:
-            todo.mark_complete()
-            self._save()
+            if todo.status != Status.COMPLETED:
+                todo.mark_complete()
+                self._index(todo)
+                self._record([self._put(todo)])
             return todo
         return None
         
     def mark_pending(self, todo_id: str) -> Optional[Todo]:
-        """Mark a todo as pending (uncomplete it)."""
+        """Mark a todo as pending (uncomplete it). Already pending todos are left untouched."""
         todo = self.get(todo_id)
         if todo:
-            todo.mark_pending()
-            self._save()
+            if todo.status != Status.PENDING:
+                todo.mark_pending()
+                self._index(todo)
+                self._record([self._put(todo)])
             return todo
         return None
 
+    def mark_complete_many(self, todo_ids: Iterable[str]) -> List[Todo]:
+        """Mark several todos as completed, logging the changes together. Unknown IDs are skipped."""
+        completed = []
+        changed = []
+        for todo_id in todo_ids:
+            todo = self.get(todo_id)
+            if todo:
+                if todo.status != Status.COMPLETED:
+                    todo.mark_complete()
+                    self._index(todo)
+                    changed.append(todo)
+                completed.append(todo)
+        if changed:
+            self._record([self._put(todo) for todo in changed])
+        return completed
+
+    def mark_pending_many(self, todo_ids: Iterable[str]) -> List[Todo]:
+        """Mark several todos as pending, logging the changes together. Unknown IDs are skipped."""
+        pending = []
+        changed = []
+        for todo_id in todo_ids:
+            todo = self.get(todo_id)
+            if todo:
+                if todo.status != Status.PENDING:
+                    todo.mark_pending()
+                    self._index(todo)
+                    changed.append(todo)
+                pending.append(todo)
+        if changed:
+            self._record([self._put(todo) for todo in changed])
+        return pending
+
     def filter(self, status: Optional[Status] = None, 
                file_path: Optional[str] = None) -> List[Todo]:
         """Filter todos by status and/or file path.
@@ -171,14 +527,14 @@ class TodoStore:
         Args:
             status: Filter by todo status (completed or pending)
             file_path: Filter by file path (supports partial matching)
-        """
-        filtered = self.get_all()
         
-        if status is not None:
-            filtered = [todo for todo in filtered if todo.status == status]
+        With a status, only todos with that status are visited, in the order
+        they took it on.
+        """
+        candidates = self.todos if status is None else self._by_status[status]
+        if file_path is None:
+            return list(candidates.values())
         
-        if file_path is not None:
-            # Support partial matching for file paths
-            filtered = [todo for todo in filtered if todo.file_path and file_path in todo.file_path]
-            
-        return filtered
+        # Support partial matching for file paths, in one pass over the candidates
+        return [todo for todo in candidates.values()
+                if todo.file_path and file_path in todo.file_path]